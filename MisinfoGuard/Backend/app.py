@@ -1,22 +1,40 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
 import time
 import uuid
 from datetime import datetime
 
+from src.core import llm
 from src.core.models import AnalysisRequest, AnalysisResponse
 from src.agents.coordinator import CoordinatorAgent
-from src.observability.logger import get_logger, set_trace_id_for_all
+from src.observability.logger import get_logger, flush_logs, TRACE_ID
 from src.observability.tracer import get_tracer
 from src.observability.metrics import get_metrics
 
 logger = get_logger(__name__)
 metrics = get_metrics()
 
+# Metric handles are bound once; each update is then a direct cell/sketch write
+requests_total = metrics.counter("analysis_requests_total")
+claims_analyzed_total = metrics.counter("claims_analyzed_total")
+cache_hits_total = metrics.counter("cache_hits_total")
+errors_total = metrics.counter("analysis_errors_total")
+analysis_duration = metrics.histogram("analysis_duration_seconds")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep shared LLM HTTP clients open for the lifetime of the app"""
+    yield
+    await llm.aclose()
+    flush_logs()
+
 app = FastAPI(
     title="MisinfoGuard v2 - Multi-Agent System",
     version="2.0.0",
-    description="Advanced misinformation detection with multi-agent architecture"
+    description="Advanced misinformation detection with multi-agent architecture",
+    lifespan=lifespan
 )
 
 # CORS
@@ -34,9 +52,12 @@ coordinator = CoordinatorAgent()
 @app.middleware("http")
 async def add_trace_id(request, call_next):
     """Add trace ID to all requests"""
-    trace_id = str(uuid.uuid4())[:8]
-    set_trace_id_for_all(trace_id)
-    get_tracer().start_trace(trace_id)
+    # Continue the caller's trace if it sent a W3C traceparent header
+    tracer = get_tracer()
+    context = tracer.extract(request.headers)
+    trace_id, parent_span_id, sampled = context if context else (uuid.uuid4().hex, None, None)
+    TRACE_ID.set(trace_id)
+    tracer.start_trace(trace_id, parent_span_id, sampled)
     
     response = await call_next(request)
     response.headers["X-Trace-ID"] = trace_id
@@ -58,8 +79,8 @@ async def analyze_claim(request: AnalysisRequest):
     claim = request.claim.strip()
     url = request.url
     
-    logger.info(f"📥 Verification request", claim=claim, url=url)
-    metrics.counter("analysis_requests_total").inc()
+    logger.info("📥 Verification request", claim=claim, url=url)
+    requests_total.inc()
     
     try:
         # Execute multi-AI verification
@@ -68,16 +89,16 @@ async def analyze_claim(request: AnalysisRequest):
         processing_time = time.time() - start_time
         
         # Record metrics
-        metrics.histogram("analysis_duration_seconds").observe(processing_time)
-        metrics.counter("claims_analyzed_total").inc()
+        analysis_duration.observe(processing_time)
+        claims_analyzed_total.inc()
         
         # Check if from cache
         cached = analysis.cached
         if cached:
-            metrics.counter("cache_hits_total").inc()
+            cache_hits_total.inc()
         
         logger.info(
-            f"✅ Verification complete",
+            "✅ Verification complete",
             claim=claim,
             verdict=analysis.final_verdict,
             duration_ms=round(processing_time * 1000, 2),
@@ -91,11 +112,11 @@ async def analyze_claim(request: AnalysisRequest):
         )
         
     except Exception as e:
-        metrics.counter("analysis_errors_total").inc()
-        logger.error(f"❌ Verification failed", claim=claim, error=str(e))
+        errors_total.inc()
+        logger.error("❌ Verification failed", claim=claim, error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/")
+@app.get("/", response_model=dict)
 async def root():
     """API info"""
     return {
@@ -118,7 +139,7 @@ async def root():
         }
     }
 
-@app.get("/health")
+@app.get("/health", response_model=dict)
 async def health_check():
     """Health check"""
     return {
@@ -133,12 +154,12 @@ async def health_check():
         }
     }
 
-@app.get("/metrics")
+@app.get("/metrics", response_model=dict)
 async def get_metrics_endpoint():
     """Get performance metrics"""
     return metrics.get_metrics()
 
-@app.get("/memory/stats")
+@app.get("/memory/stats", response_model=dict)
 async def get_memory_stats():
     """Get memory bank statistics"""
     return coordinator.memory_bank.get_stats()
@@ -153,18 +174,19 @@ user_manager = UserManager()
 async def signup(user: UserSignup):
     """Register a new user"""
     try:
-        created_user = user_manager.create_user(user)
+        # Password hashing is CPU-bound; keep it off the event loop
+        created_user = await asyncio.to_thread(user_manager.create_user, user)
         return created_user
     except ValueError as e:
          raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Signup error: {e}")
+        logger.error("Signup error: %s", e)
         raise HTTPException(status_code=500, detail=f"Signup processing failed: {str(e)}")
 
 @app.post("/auth/login", response_model=Token)
 async def login(user: UserLogin):
     """Login and get access token"""
-    authenticated_user = user_manager.authenticate_user(user.email, user.password)
+    authenticated_user = await asyncio.to_thread(user_manager.authenticate_user, user.email, user.password)
     if not authenticated_user:
         raise HTTPException(status_code=401, detail="Incorrect email or password")
     
@@ -202,5 +224,16 @@ async def read_users_me(authorization: str = Header(None)):
         raise HTTPException(status_code=401, detail="Invalid authentication")
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows support
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        log_level="warning",
+        access_log=False
+    )
@@ -32,13 +32,13 @@ def main():
     verifier = VerifierAgent()
     explainer = ExplainerAgent()
 
-    for claim in claims[:2]: 
+    # Verify all selected claims with a single model call
+    console.print("[bold cyan]Verifying...[/bold cyan]")
+    verification_results = verifier.verify_batch(claims[:2])
+
+    for claim, verification_result in zip(claims[:2], verification_results): 
         console.print(Panel(f"[bold yellow]Processing Claim:[/bold yellow] {claim}"))
         
-        # Verify
-        console.print("[bold cyan]Verifying...[/bold cyan]")
-        verification_result = verifier.verify(claim)
-        
         status_color = "green" if verification_result.get("status") == "True" else "red"
         console.print(f"Status: [{status_color}]{verification_result.get('status')}[/{status_color}]")
         
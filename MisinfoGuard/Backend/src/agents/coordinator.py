@@ -1,14 +1,17 @@
 import os
+import re
 import asyncio
-import google.generativeai as genai
-from typing import List, Optional, Dict
-from datetime import datetime
-import json
+import time
+from functools import lru_cache
+from typing import Callable, List, Optional, Dict, Tuple
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
-from groq import Groq
 
+from src.core import llm
+from src.core.batching import BatchScheduler
 from src.core.models import ClaimAnalysis, Evidence, AIVerdict
-from src.memory.memory_bank import MemoryBank
+from src.memory.memory_bank import MemoryBank, hash_topic
+from src.memory.semantic_index import SemanticIndex, token_jaccard
 from src.observability.logger import get_logger
 from src.observability.tracer import trace_operation
 
@@ -16,12 +19,84 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
+# Request coalescing for LLM verification calls
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "8"))
+BATCH_WAIT_MS = float(os.getenv("BATCH_WAIT_MS", "30"))
+
+# Cosine similarity above which a paraphrased claim reuses a stored analysis
+SEMANTIC_MATCH_THRESHOLD = float(os.getenv("SEMANTIC_MATCH_THRESHOLD", "0.92"))
+# Matches must also share this fraction of words, so short claims that embed
+# close together but are about different things don't collide
+SEMANTIC_MIN_TOKEN_OVERLAP = 0.3
+SEMANTIC_CANDIDATES = 5
+# Budget for the claim embedding; past it the semantic lookup is skipped, so
+# a slow or unreachable embedding endpoint never stalls verification
+EMBED_TIMEOUT_MS = float(os.getenv("EMBED_TIMEOUT_MS", "300"))
+
+CREDIBILITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# Query parameters that never change page content
+TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid=', 'gclid=')
+
+# Verification instructions are identical across calls, so they are sent as a
+# system prompt (cached server-side); only the claim and evidence template vary
+VERIFY_SYSTEM_PROMPT = """You are a Crisis Verification Expert. Verify the incoming report during a potential emergency situation.
+
+Determine the status of the claim based STRICTLY on the evidence provided:
+- TRUE: Confirmed by official government sources or multiple reliable news outlets.
+- FALSE: Debunked by official sources or police clarifications.
+- MISLEADING: Contains grains of truth but is exaggerated or out of context.
+- UNVERIFIED: No credible evidence found yet.
+
+Return ONLY valid JSON:
+{
+  "verdict": "FALSE",
+  "confidence": 0.95,
+  "reasoning": "Brief, urgent explanation focusing on public safety."
+}"""
+
+VERIFY_PROMPT = """CLAIM: "{claim}"
+
+EVIDENCE FROM SOURCES:
+{evidence}"""
+
+BATCH_VERIFY_SYSTEM_PROMPT = """You are a Crisis Verification Expert. Verify each numbered claim, each given its own evidence block, during a potential emergency situation.
+
+For EACH claim, determine its status based STRICTLY on its own evidence:
+- TRUE: Confirmed by official government sources or multiple reliable news outlets.
+- FALSE: Debunked by official sources or police clarifications.
+- MISLEADING: Contains grains of truth but is exaggerated or out of context.
+- UNVERIFIED: No credible evidence found yet.
+
+Return ONLY a valid JSON array with one object per claim, in order:
+[
+  {
+    "id": 1,
+    "verdict": "FALSE",
+    "confidence": 0.95,
+    "reasoning": "Brief, urgent explanation focusing on public safety."
+  }
+]"""
+
+BATCH_VERIFY_PROMPT = """Verify claims 1..{count}.
+
+{claims}"""
+
+BATCH_CLAIM_BLOCK = """CLAIM {index}: "{claim}"
+
+EVIDENCE FOR CLAIM {index}:
+{evidence}"""
+
+EVIDENCE_ITEM = """{index}. [{credibility}] {title}
+   {snippet}
+   Source: {url}"""
+
 class BaseAgent:
     """Base class for all agents with common functionality"""
     
     def __init__(self, name: str):
         self.name = name
-        logger.info(f"✅ Initialized {name}")
+        logger.info("✅ Initialized %s", name)
     
     async def execute(self, **kwargs):
         """Override in subclass"""
@@ -30,40 +105,66 @@ class BaseAgent:
 class EvidenceGathererAgent(BaseAgent):
     """Specialized agent for gathering evidence from web sources"""
     
+    # High credibility sources - CRISIS MODE
+    HIGH_CRED_DOMAINS = frozenset([
+        # 1. Official Government & Safety (India Focused)
+        'gov.in', 'nic.in', 'police.gov.in', 'mha.gov.in', 'ndma.gov.in', 'who.int', 'pib.gov.in',
+        # 2. Major Verified News & Wire Services
+        'reuters.com', 'aninews.in', 'ptinews.com', 'thehindu.com', 'indianexpress.com', 'ndtv.com', 'ddnews.gov.in',
+        # 3. Established Fact-Checkers
+        'factcheck.org', 'snopes.com', 'politifact.com', 'altnews.in', 'boomlive.in', 'vishvasnews.com',
+    ])
+    
+    # Low credibility sources, matched anywhere in the domain (e.g. *.blogspot.com)
+    LOW_CRED_PATTERN = re.compile('|'.join(map(re.escape, [
+        'blog', 'wordpress', 'medium', 'facebook', 'twitter', 'reddit', 'tiktok', 'instagram', 'whatsapp'
+    ])))
+    
     def __init__(self):
         super().__init__("EvidenceGatherer")
         from src.tools.search import SearchTool
         self.search_tool = SearchTool()
     
-    @trace_operation("evidence_gathering")
     async def gather(self, claim: str) -> List[Evidence]:
-        """Gather evidence from multiple sources in parallel"""
-        logger.info(f"🔎 Gathering evidence for claim: {claim}")
-        
-        # Search queries focused on crisis verification and official sources
-        queries = [
-            f"{claim} official statement",
-            f"{claim} police verification",
-            f"{claim} fact check india",
-            f"{claim} government notification"
-        ]
+        """Gather all evidence for a claim, ranked by credibility"""
+        queue = asyncio.Queue()
+        await self.stream(claim, queue)
         
-        # Execute searches in parallel
-        tasks = [
-            asyncio.to_thread(self.search_tool.search, query, max_results=3)
-            for query in queries
-        ]
+        all_evidence = []
+        while (evidence := queue.get_nowait()) is not None:
+            all_evidence.append(evidence)
         
-        results_list = await asyncio.gather(*tasks)
+        return self.rank(all_evidence)
+    
+    @trace_operation("evidence_gathering")
+    async def stream(self, claim: str, queue: asyncio.Queue):
+        """
+        Search for evidence and push each new Evidence onto the queue as
+        results are processed. A final None marks the end.
+        """
+        logger.info("🔎 Gathering evidence for claim: %s", claim)
         
-        # Deduplicate and convert to Evidence
-        all_evidence = []
+        # One combined query focused on crisis verification and official sources.
+        # The claim stays unquoted (an exact-phrase match on a whole sentence
+        # finds almost nothing); stray quotes are stripped so it can't open one
+        terms = claim.replace('"', ' ')
+        query = f'{terms} (official OR "police verification" OR "fact check india" OR "government notification")'
+        
+        # Deduplicate and convert to Evidence as results arrive
         seen_urls = set()
         
-        for results in results_list:
+        try:
+            results = await self.search_tool.search_async(query, max_results=12)
+            
             for result in results:
                 url = result.get('href')
-                if not url or url in seen_urls:
+                if not url:
+                    continue
+                
+                # Same page regardless of scheme, trailing slash, fragment or tracking params
+                parts = urlsplit(url)
+                url_key = (parts.netloc.lower(), parts.path.rstrip('/'), self._strip_tracking(parts.query))
+                if url_key in seen_urls:
                     continue
                 
                 # Filter out Chinese/Foreign domains if they leak through
@@ -71,50 +172,45 @@ class EvidenceGathererAgent(BaseAgent):
                     continue
                     
                 # Assess credibility based on domain
-                domain = url.split('/')[2] if '/' in url else url
-                credibility = self._assess_credibility(domain)
+                credibility = self._assess_credibility(parts.hostname or '')
                 
-                evidence = Evidence(
-                    title=result.get('title', 'Unknown'),
-                    url=url,
-                    snippet=result.get('body', '')[:200],
-                    credibility=credibility
-                )
-                all_evidence.append(evidence)
-                seen_urls.add(url)
+                queue.put_nowait(Evidence.from_search_result(result, credibility))
+                seen_urls.add(url_key)
+        finally:
+            queue.put_nowait(None)
         
-        # Sort by credibility (high first)
-        credibility_order = {"high": 0, "medium": 1, "low": 2}
-        all_evidence.sort(key=lambda e: credibility_order.get(e.credibility or "medium", 1))
-        
-        logger.info(f"✅ Gathered {len(all_evidence)} evidence sources")
-        return all_evidence[:10]  # Top 10 sources
+        logger.info("✅ Gathered %s evidence sources", len(seen_urls))
+    
+    @staticmethod
+    def _strip_tracking(query: str) -> str:
+        """Drop analytics parameters (utm_*, fbclid, gclid) from a query string"""
+        if not query:
+            return query
+        return '&'.join(
+            param for param in query.split('&')
+            if param and not param.startswith(TRACKING_PARAM_PREFIXES)
+        )
     
-    def _assess_credibility(self, domain: str) -> str:
-        """Assess source credibility based on domain"""
+    @staticmethod
+    def rank(evidence: List[Evidence]) -> List[Evidence]:
+        """Sort evidence by credibility (high first) and keep the top 10"""
+        return sorted(
+            evidence,
+            key=lambda e: CREDIBILITY_ORDER.get(e.credibility or "medium", 1)
+        )[:10]
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _assess_credibility(domain: str) -> str:
+        """Assess source credibility based on domain (memoized per process)"""
         domain_lower = domain.lower()
         
-        # High credibility sources - CRISIS MODE
-        
-        # 1. Official Government & Safety (India Focused)
-        official_gov = ['gov.in', 'nic.in', 'police.gov.in', 'mha.gov.in', 'ndma.gov.in', 'who.int', 'pib.gov.in']
-        
-        # 2. Major Verified News & Wire Services
-        major_news = ['reuters.com', 'ani', 'pti', 'thehindu.com', 'indianexpress.com', 'ndtv.com', 'ddnews.gov.in']
-        
-        # 3. Established Fact-Checkers
-        fact_checkers = ['factcheck.org', 'snopes.com', 'politifact.com', 'altnews.in', 'boomlive.in', 'vishvasnews.com']
-        
-        # Combine high credibility lists
-        high_cred = official_gov + major_news + fact_checkers
-        
-        if any(trusted in domain_lower for trusted in high_cred):
+        # Match the domain and each parent domain exactly (news.pib.gov.in -> pib.gov.in -> gov.in)
+        labels = domain_lower.split('.')
+        if any('.'.join(labels[i:]) in EvidenceGathererAgent.HIGH_CRED_DOMAINS for i in range(len(labels))):
             return "high"
         
-        # Low credibility sources
-        low_cred = ['blog', 'wordpress', 'medium', 'facebook', 'twitter', 'reddit', 'tiktok', 'instagram', 'whatsapp']
-        
-        if any(untrusted in domain_lower for untrusted in low_cred):
+        if EvidenceGathererAgent.LOW_CRED_PATTERN.search(domain_lower):
             return "low"
         
         return "medium"
@@ -125,33 +221,57 @@ class MultiAIFactChecker(BaseAgent):
     def __init__(self):
         super().__init__("MultiAIFactChecker")
         
-        # Initialize Gemini
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        self.gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        # Groq (free API) is optional
+        self.groq_enabled = llm.groq_enabled()
         
-        # Initialize Groq (free API)
-        groq_api_key = os.getenv("GROQ_API_KEY")
-        self.groq_client = Groq(api_key=groq_api_key) if groq_api_key else None
+        # Concurrent verifications share one call per model
+        self.gemini_batcher = BatchScheduler(
+            self._verify_batch_with_gemini,
+            max_batch_size=BATCH_SIZE,
+            max_latency_ms=BATCH_WAIT_MS
+        )
+        self.groq_batcher = BatchScheduler(
+            self._verify_batch_with_groq,
+            max_batch_size=BATCH_SIZE,
+            max_latency_ms=BATCH_WAIT_MS
+        ) if self.groq_enabled else None
     
     @trace_operation("multi_ai_fact_checking")
-    async def verify(self, claim: str, evidence: List[Evidence]) -> Dict:
-        """Verify claim using multiple AI models"""
-        logger.info(f"🔍 Multi-AI verification for: {claim}")
+    async def verify(
+        self,
+        claim: str,
+        evidence: List[Evidence],
+        on_verdict: Optional[Callable[[AIVerdict], None]] = None
+    ) -> Dict:
+        """
+        Verify claim using multiple AI models
+
+        `on_verdict` is called with each model's verdict as soon as it
+        arrives, before consensus is computed.
+        """
+        logger.info("🔍 Multi-AI verification for: %s", claim)
         
         evidence_summary = self._format_evidence(evidence)
         
         # Run both AI models in parallel
         tasks = [
-            self._verify_with_gemini(claim, evidence_summary),
+            self.gemini_batcher.submit((claim, evidence_summary)),
         ]
         
-        if self.groq_client:
-            tasks.append(self._verify_with_groq(claim, evidence_summary))
+        if self.groq_batcher:
+            tasks.append(self.groq_batcher.submit((claim, evidence_summary)))
         
-        verdicts = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out errors
-        valid_verdicts = [v for v in verdicts if not isinstance(v, Exception)]
+        # Collect verdicts as they complete, skipping models that failed
+        valid_verdicts = []
+        for next_verdict in asyncio.as_completed(tasks):
+            try:
+                verdict = await next_verdict
+            except Exception:
+                continue
+            
+            valid_verdicts.append(verdict)
+            if on_verdict:
+                on_verdict(verdict)
         
         if not valid_verdicts:
             logger.error("❌ All AI models failed")
@@ -165,7 +285,7 @@ class MultiAIFactChecker(BaseAgent):
         # Calculate consensus
         consensus = self._calculate_consensus(valid_verdicts)
         
-        logger.info(f"✅ Consensus: {consensus['final_verdict']} ({consensus['confidence']:.2f})")
+        logger.info("✅ Consensus: %s (%.2f)", consensus['final_verdict'], consensus['confidence'])
         return consensus
     
     def _format_evidence(self, evidence: List[Evidence]) -> str:
@@ -173,44 +293,90 @@ class MultiAIFactChecker(BaseAgent):
         if not evidence:
             return "No evidence found."
         
-        formatted = []
-        for i, e in enumerate(evidence[:5], 1):
-            formatted.append(f"{i}. [{e.credibility.upper()}] {e.title}\n   {e.snippet}\n   Source: {e.url}")
+        return "\n\n".join(
+            EVIDENCE_ITEM.format(
+                index=i,
+                credibility=(e.credibility or "medium").upper(),
+                title=e.title,
+                snippet=e.snippet,
+                url=e.url
+            )
+            for i, e in enumerate(evidence[:5], 1)
+        )
+    
+    def _format_batch_prompt(self, items: List[Tuple[str, str]]) -> str:
+        """Build one prompt verifying several numbered claims"""
+        claims_text = "\n\n---\n\n".join(
+            BATCH_CLAIM_BLOCK.format(index=i, claim=claim, evidence=evidence)
+            for i, (claim, evidence) in enumerate(items, 1)
+        )
+        return BATCH_VERIFY_PROMPT.format(count=len(items), claims=claims_text)
+    
+    def _parse_batch_verdicts(self, result_text: str, model_name: str, count: int) -> List:
+        """Map a JSON array of verdicts back to claim order"""
+        results = llm.parse_json(result_text)
+        if not isinstance(results, list):
+            results = [results]
+        
+        verdicts = [
+            ValueError(f"{model_name} returned no verdict for claim {i}")
+            for i in range(1, count + 1)
+        ]
+        for position, result in enumerate(results):
+            try:
+                index = int(result.get('id', position + 1)) - 1
+                if 0 <= index < count:
+                    verdicts[index] = AIVerdict(
+                        model_name=model_name,
+                        verdict=result['verdict'],
+                        confidence=float(result['confidence']),
+                        reasoning=result['reasoning']
+                    )
+            except Exception as e:
+                logger.warning("⚠️ Skipping malformed batch verdict", model=model_name, error=str(e))
+        
+        return verdicts
+    
+    async def _verify_batch_with_gemini(self, items: List[Tuple[str, str]]) -> List:
+        """Verify a batch of claims with a single Gemini call"""
+        if len(items) == 1:
+            return [await self._verify_with_gemini(*items[0])]
         
-        return "\n\n".join(formatted)
+        logger.info("📦 Gemini batch verification", batch_size=len(items))
+        try:
+            result_text = await llm.gemini_generate_json(
+                self._format_batch_prompt(items),
+                system_prompt=BATCH_VERIFY_SYSTEM_PROMPT,
+                max_tokens=300 * len(items)
+            )
+            return self._parse_batch_verdicts(result_text, "Gemini 2.0 Flash", len(items))
+        except Exception as e:
+            logger.error("❌ Gemini batch error: %s", e)
+            raise
+    
+    async def _verify_batch_with_groq(self, items: List[Tuple[str, str]]) -> List:
+        """Verify a batch of claims with a single Groq call"""
+        if len(items) == 1:
+            return [await self._verify_with_groq(*items[0])]
+        
+        logger.info("📦 Groq batch verification", batch_size=len(items))
+        try:
+            result_text = await llm.groq_chat_json(
+                self._format_batch_prompt(items),
+                system_prompt=BATCH_VERIFY_SYSTEM_PROMPT,
+                max_tokens=300 * len(items)
+            )
+            return self._parse_batch_verdicts(result_text, "Llama 3.3 70B", len(items))
+        except Exception as e:
+            logger.error("❌ Groq batch error: %s", e)
+            raise
     
     async def _verify_with_gemini(self, claim: str, evidence: str) -> AIVerdict:
         """Verify using Google Gemini"""
-        prompt = f"""You are a Crisis Verification Expert. verify this incoming report during a potential emergency situation.
-
-CLAIM: "{claim}"
-
-EVIDENCE FROM SOURCES:
-{evidence}
-
-Determine the status of this claim based STRICTLY on the evidence provided:
-- TRUE: Confirmed by official government sources or multiple reliable news outlets.
-- FALSE: Debunked by official sources or police clarifications.
-- MISLEADING: Contains grains of truth but is exaggerated or out of context.
-- UNVERIFIED: No credible evidence found yet.
-
-Return ONLY valid JSON:
-{{
-  "verdict": "FALSE",
-  "confidence": 0.95,
-  "reasoning": "Brief, urgent explanation focusing on public safety."
-}}"""
+        prompt = VERIFY_PROMPT.format(claim=claim, evidence=evidence)
 
         try:
-            response = await asyncio.to_thread(
-                self.gemini_model.generate_content,
-                prompt
-            )
-            
-            result_text = response.text.strip()
-            result_text = result_text.replace("```json", "").replace("```", "").strip()
-            
-            result = json.loads(result_text)
+            result = llm.parse_json(await llm.gemini_generate_json(prompt, system_prompt=VERIFY_SYSTEM_PROMPT))
             
             return AIVerdict(
                 model_name="Gemini 2.0 Flash",
@@ -219,44 +385,15 @@ Return ONLY valid JSON:
                 reasoning=result['reasoning']
             )
         except Exception as e:
-            logger.error(f"❌ Gemini error: {e}")
+            logger.error("❌ Gemini error: %s", e)
             raise
     
     async def _verify_with_groq(self, claim: str, evidence: str) -> AIVerdict:
         """Verify using Groq (Llama)"""
-        prompt = f"""You are a Crisis Verification Expert. verify this incoming report during a potential emergency situation.
-
-CLAIM: "{claim}"
-
-EVIDENCE FROM SOURCES:
-{evidence}
-
-Determine the status of this claim based STRICTLY on the evidence provided:
-- TRUE: Confirmed by official government sources or multiple reliable news outlets.
-- FALSE: Debunked by official sources or police clarifications.
-- MISLEADING: Contains grains of truth but is exaggerated or out of context.
-- UNVERIFIED: No credible evidence found yet.
-
-Return ONLY valid JSON:
-{{
-  "verdict": "FALSE",
-  "confidence": 0.95,
-  "reasoning": "Brief, urgent explanation focusing on public safety."
-}}"""
+        prompt = VERIFY_PROMPT.format(claim=claim, evidence=evidence)
 
         try:
-            response = await asyncio.to_thread(
-                self.groq_client.chat.completions.create,
-                messages=[{"role": "user", "content": prompt}],
-                model="llama-3.3-70b-versatile",
-                temperature=0.1,
-                max_tokens=500
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            result_text = result_text.replace("```json", "").replace("```", "").strip()
-            
-            result = json.loads(result_text)
+            result = llm.parse_json(await llm.groq_chat_json(prompt, system_prompt=VERIFY_SYSTEM_PROMPT))
             
             return AIVerdict(
                 model_name="Llama 3.3 70B",
@@ -265,7 +402,7 @@ Return ONLY valid JSON:
                 reasoning=result['reasoning']
             )
         except Exception as e:
-            logger.error(f"❌ Groq error: {e}")
+            logger.error("❌ Groq error: %s", e)
             raise
     
     def _calculate_consensus(self, verdicts: List[AIVerdict]) -> Dict:
@@ -306,13 +443,11 @@ class ExplainerAgent(BaseAgent):
     
     def __init__(self):
         super().__init__("Explainer")
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
     
     @trace_operation("explanation_generation")
     async def explain(self, claim: str, verdict: str, reasoning: str, sources: List[Evidence]) -> str:
         """Generate clear, Community Notes-style explanation"""
-        logger.info(f"📝 Generating explanation")
+        logger.info("📝 Generating explanation")
         
         sources_text = "\n".join([
             f"- [{s.title}]({s.url})"
@@ -336,13 +471,9 @@ Instructions:
 5. Use Markdown."""
 
         try:
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt
-            )
-            return response.text
+            return await llm.gemini_generate(prompt)
         except Exception as e:
-            logger.error(f"❌ Explanation error: {e}")
+            logger.error("❌ Explanation error: %s", e)
             return reasoning
 
 class CoordinatorAgent(BaseAgent):
@@ -354,32 +485,69 @@ class CoordinatorAgent(BaseAgent):
         self.fact_checker = MultiAIFactChecker()
         self.explainer_agent = ExplainerAgent()
         self.memory_bank = MemoryBank()
+        self.semantic_index = SemanticIndex(threshold=SEMANTIC_MATCH_THRESHOLD)
+        
+        # Verifications currently running, keyed by normalized claim hash
+        self._inflight: Dict[str, asyncio.Task] = {}
     
     @trace_operation("coordination")
     async def analyze(self, claim: str, url: Optional[str] = None) -> ClaimAnalysis:
         """
         Orchestrate multi-agent claim verification workflow
         
-        1. Check memory for cached results
-        2. Gather evidence from credible sources
-        3. Multi-AI verification (Gemini + Groq)
+        1. Check memory for cached results, or join an identical
+           verification that is already running
+        2. Stream evidence from credible sources
+        3. Multi-AI verification (Gemini + Groq), started once enough
+           credible evidence has arrived
         4. Generate explanation
         5. Store in memory
         """
-        logger.info(f"🎯 Coordinating verification for: {claim}")
+        logger.info("🎯 Coordinating verification for: %s", claim)
         
         # Step 1: Check memory
         cached_result = self.memory_bank.get(claim)
         if cached_result:
-            logger.info(f"⚡ Retrieved from memory bank")
+            logger.info("⚡ Retrieved from memory bank")
             return cached_result[0] if isinstance(cached_result, list) else cached_result
         
+        # Concurrent requests for the same claim share a single pipeline run
+        key = hash_topic(claim)
+        task = self._inflight.get(key)
+        if task is not None:
+            logger.info("🔗 Joining in-flight verification", claim=claim)
+        else:
+            # The pipeline runs in its own task, so a caller that disconnects
+            # or times out (the first one included) doesn't cancel it for the rest
+            task = asyncio.create_task(self._verify_claim(claim))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        return await asyncio.shield(task)
+    
+    def _finish_inflight(self, key: str, task: asyncio.Task):
+        """Forget a finished shared verification"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Don't warn about an unretrieved exception when every caller left
+    
+    async def _verify_claim(self, claim: str) -> ClaimAnalysis:
+        """Run the evidence -> verification -> explanation pipeline for an uncached claim"""
         # Step 2: Gather evidence
-        logger.info(f"🚀 Gathering evidence")
-        evidence = await self.evidence_agent.gather(claim)
-        
+        logger.info("🚀 Gathering evidence")
+        gathering = asyncio.create_task(self.evidence_agent.gather(claim))
+        
+        # A paraphrase of an already verified claim reuses its analysis;
+        # the embedding call overlaps with the evidence search
+        vector = await self._embed_claim(claim)
+        similar = self._find_similar(claim, vector)
+        if similar:
+            gathering.cancel()
+            return similar
+        
+        evidence = await gathering
         if not evidence:
-            logger.warning(f"⚠️ No evidence found")
+            logger.warning("⚠️ No evidence found")
             return ClaimAnalysis(
                 claim=claim,
                 final_verdict="UNVERIFIED",
@@ -387,20 +555,41 @@ class CoordinatorAgent(BaseAgent):
                 explanation="Unable to find sufficient evidence to verify this claim.",
                 ai_verdicts=[],
                 sources=[],
-                analyzed_at=datetime.now(),
+                analyzed_at=time.time(),
                 cached=False
             )
         
         # Step 3: Multi-AI verification
-        verification = await self.fact_checker.verify(claim, evidence)
-        
-        # Step 4: Generate explanation
-        explanation = await self.explainer_agent.explain(
-            claim,
-            verification['final_verdict'],
-            verification['reasoning'],
-            evidence
+        draft = {}
+        
+        def start_draft(verdict: AIVerdict):
+            # Speculatively explain the first verdict while other models are still running
+            if not draft:
+                draft["verdict"] = verdict.verdict
+                draft["task"] = asyncio.create_task(
+                    self.explainer_agent.explain(claim, verdict.verdict, verdict.reasoning, evidence)
+                )
+        
+        verification = await self.fact_checker.verify(claim, evidence, on_verdict=start_draft)
+        
+        # Step 4: Generate explanation, keeping the draft if every model agreed with it
+        final_verdict = verification['final_verdict']
+        draft_task = draft.get("task")
+        draft_agreed = draft_task is not None and all(
+            v.verdict == draft["verdict"] for v in verification['ai_verdicts']
         )
+        if draft_agreed:
+            explanation = await draft_task
+        else:
+            if draft_task:
+                logger.info("🔁 Models disagreed, regenerating explanation", draft_verdict=draft["verdict"])
+                draft_task.cancel()
+            explanation = await self.explainer_agent.explain(
+                claim,
+                final_verdict,
+                verification['reasoning'],
+                evidence
+            )
         
         # Create analysis
         analysis = ClaimAnalysis(
@@ -410,13 +599,50 @@ class CoordinatorAgent(BaseAgent):
             explanation=explanation,
             ai_verdicts=verification['ai_verdicts'],
             sources=evidence[:5],  # Top 5 sources
-            analyzed_at=datetime.now(),
+            analyzed_at=time.time(),
             cached=False
         )
         
         # Step 5: Store in memory
         self.memory_bank.store(claim, [analysis])
-        logger.info(f"💾 Stored in memory bank")
-        
-        logger.info(f"✅ Verification complete: {verification['final_verdict']}")
+        if vector is not None:
+            try:
+                self.semantic_index.add(hash_topic(claim), vector)
+            except Exception as e:
+                logger.warning("⚠️ Semantic index update failed", error=str(e))
+        logger.info("💾 Stored in memory bank")
+        
+        logger.info("✅ Verification complete: %s", verification['final_verdict'])
         return analysis
+    
+    async def _embed_claim(self, claim: str) -> Optional[List[float]]:
+        """Embed a claim for near-duplicate lookup; None if the embedding call fails or is slow"""
+        try:
+            return await asyncio.wait_for(llm.gemini_embed(claim), EMBED_TIMEOUT_MS / 1000)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️ Claim embedding timed out, skipping semantic lookup", timeout_ms=EMBED_TIMEOUT_MS)
+            return None
+        except Exception as e:
+            logger.warning("⚠️ Claim embedding failed", error=str(e))
+            return None
+    
+    def _find_similar(self, claim: str, vector: Optional[List[float]]) -> Optional[ClaimAnalysis]:
+        """Return a stored analysis for a near-duplicate claim, if any"""
+        if vector is None:
+            return None
+        
+        try:
+            candidates = self.semantic_index.search(vector, k=SEMANTIC_CANDIDATES)
+        except Exception as e:
+            logger.warning("⚠️ Semantic lookup failed", error=str(e))
+            return None
+        
+        for topic_hash, similarity in candidates:
+            cached_result = self.memory_bank.get_by_hash(topic_hash)
+            if not cached_result:
+                continue
+            if token_jaccard(claim, cached_result[0].claim) < SEMANTIC_MIN_TOKEN_OVERLAP:
+                continue
+            logger.info("⚡ Retrieved near-duplicate from memory bank", similarity=round(similarity, 3))
+            return cached_result[0]
+        return None
@@ -1,21 +1,22 @@
-import os
-import google.generativeai as genai
 from typing import Dict
+from src.core.llm import get_gemini_model
+from src.observability.logger import get_logger
 from dotenv import load_dotenv
 import time
 
 load_dotenv()
 
+logger = get_logger(__name__)
+
 class ExplainerAgent:
     def __init__(self):
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.model = get_gemini_model()
 
     def explain(self, claim: str, verification_result: Dict) -> str:
         """
         Generates a clear, accessible explanation of the verification.
         """
-        print(f"Generating explanation for: {claim}...")
+        logger.debug("📝 Generating explanation", claim=claim)
 
         prompt = f"""
         You are a helpful AI assistant dedicated to fighting misinformation.
@@ -43,7 +44,7 @@ class ExplainerAgent:
                     return response.text
                 raise ValueError("Empty response from API")
             except Exception as e:
-                print(f"Error in ExplainerAgent (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.error("❌ ExplainerAgent error", attempt=attempt + 1, max_retries=max_retries, error=str(e))
                 if attempt < max_retries - 1:
                     time.sleep(1)
                     continue
@@ -1,40 +1,47 @@
-import os
-import json
-import google.generativeai as genai
+import orjson
 from typing import List
+from src.core.llm import get_gemini_model, parse_json
 from src.tools.search import SearchTool
+from src.observability.logger import get_logger
 from dotenv import load_dotenv
 import time
 
 load_dotenv()
 
+logger = get_logger(__name__)
+
 class MonitorAgent:
     def __init__(self):
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.model = get_gemini_model()
         self.search_tool = SearchTool()
 
     def scan(self, topic: str) -> List[str]:
         """
         Scans for trending claims or headlines related to a topic.
         """
-        print(f"Scanning for news on: {topic}...")
+        logger.debug("🔍 Scanning for news", topic=topic)
         # Reduced from 10 to 5 for performance
         news_results = self.search_tool.news_search(topic, max_results=5)
         
         if not news_results:
-            print("News search failed or empty. Trying text search...")
+            logger.warning("⚠️ News search failed or empty, trying text search", topic=topic)
             news_results = self.search_tool.search(f"{topic} news", max_results=5)
 
         if not news_results:
-            print("Search failed. Using mock data for demonstration.")
+            logger.warning("⚠️ Search failed, using mock data for demonstration", topic=topic)
             news_results = [
                 {"title": f"New study claims {topic} is accelerating faster than predicted", "body": "Scientists warn of irreversible tipping points."},
                 {"title": f"Viral post claims {topic} is a hoax", "body": "Social media users share debunked theories."},
                 {"title": f"Government announces new policy on {topic}", "body": "Legislation aims to reduce impact by 2030."}
             ]
         
-        print(f"Found {len(news_results)} items.")
+        logger.debug("📰 News items found", count=len(news_results))
+
+        # One compact line per item; a repr of the result dicts wastes tokens on keys and quoting
+        news_lines = "\n".join(
+            f"- {r.get('title', '')}: {(r.get('body') or '')[:120]}"
+            for r in news_results
+        )
 
         prompt = f"""
         Analyze the following news headlines and snippets related to '{topic}'.
@@ -45,7 +52,7 @@ class MonitorAgent:
         ["Claim 1", "Claim 2", "Claim 3"]
 
         News Data:
-        {news_results}
+        {news_lines}
         """
 
         # Retry logic for API calls
@@ -53,28 +60,24 @@ class MonitorAgent:
         for attempt in range(max_retries):
             try:
                 response = self.model.generate_content(prompt)
-                print(f"Gemini Raw Response: {response.text}")
-                claims_text = response.text.strip()
-                
-                # Clean up any markdown code blocks
-                claims_text = claims_text.replace("```json", "").replace("```python", "").replace("```", "").strip()
+                logger.debug("📝 Gemini raw response", text=response.text)
                 
-                # Parse JSON safely instead of using eval()
-                claims = json.loads(claims_text)
+                # Parse JSON safely instead of using eval(), ignoring any markdown code blocks
+                claims = parse_json(response.text)
                 
                 # Ensure we return max 3 claims
                 if isinstance(claims, list):
                     return claims[:3]
                 return [str(claims)]
                 
-            except json.JSONDecodeError as e:
-                print(f"JSON parsing error (attempt {attempt + 1}/{max_retries}): {e}")
+            except orjson.JSONDecodeError as e:
+                logger.warning("❌ JSON parsing error", attempt=attempt + 1, max_retries=max_retries, error=str(e))
                 if attempt < max_retries - 1:
                     time.sleep(1)
                     continue
                 return []
             except Exception as e:
-                print(f"Error in MonitorAgent (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.error("❌ MonitorAgent error", attempt=attempt + 1, max_retries=max_retries, error=str(e))
                 if attempt < max_retries - 1:
                     time.sleep(1)
                     continue
@@ -1,102 +1,181 @@
-import os
-import json
-import google.generativeai as genai
-from typing import Dict
+import asyncio
+import orjson
+from typing import Dict, List, Optional
+from src.core.llm import gemini_model_with_system_prompt, parse_json
 from src.tools.search import SearchTool
+from src.observability.logger import get_logger
 from dotenv import load_dotenv
 import time
 
 load_dotenv()
 
+logger = get_logger(__name__)
+
 class VerifierAgent:
+    # Static instructions, cached server-side; only the claims and evidence vary per call
+    SYSTEM_PROMPT = """You are an expert misinformation analyst.
+
+For EACH claim you are given:
+1. Analyze its evidence to determine the veracity of the claim.
+2. Assign a status: "Verified Fact", "Misinformation", "Misleading", or "Unverified".
+3. Select the top 3 most credible sources from its evidence list to support your decision.
+
+IMPORTANT: Return ONLY a valid JSON array (no markdown, no code blocks) with one object per claim, in this exact format:
+[
+    {
+        "id": 1,
+        "status": "Verified Fact" | "Misinformation" | "Misleading" | "Unverified",
+        "explanation": "Clear, concise summary of why this is true/false...",
+        "sources": ["Source Name 1", "Source Name 2"]
+    }
+]"""
+
     def __init__(self):
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
         self.search_tool = SearchTool()
 
     def verify(self, claim: str) -> Dict:
         """
         Verifies a specific claim by cross-referencing with search results.
         """
-        # Strategy: Run two searches to get broader context and specific fact checks
-        print(f"Verifying claim: {claim}...")
-        
-        # 1. Direct search for the claim
-        results_direct = self.search_tool.search(claim, max_results=3)
-        # 2. Fact check specific search
-        results_factcheck = self.search_tool.search(f"{claim} fact check truth", max_results=3)
-        
-        # Combine and deduplicate based on URL
-        all_results = results_direct + results_factcheck
-        seen_urls = set()
-        unique_results = []
-        for r in all_results:
-            if r.get('href') not in seen_urls:
-                unique_results.append(r)
-                seen_urls.add(r.get('href'))
-        
-        if not unique_results:
-            return {"status": "Unverified", "reason": "No evidence found", "evidence_data": []}
-
-        prompt = f"""
-        You are an expert misinformation analyst.
-        Claim: "{claim}"
-
-        Evidence from Web Search:
-        {unique_results}
-
-        Task:
-        1. Analyze the evidence to determine the veracity of the claim.
-        2. Assign a status: "Verified Fact", "Misinformation", "Misleading", or "Unverified".
-        3. Select the top 3 most credible sources from the evidence list to support your decision.
-
-        IMPORTANT: Return ONLY a valid JSON object (no markdown, no code blocks) in this exact format:
-        {{
-            "status": "Verified Fact" | "Misinformation" | "Misleading" | "Unverified",
-            "explanation": "Clear, concise summary of why this is true/false...",
-            "sources": ["Source Name 1", "Source Name 2"]
-        }}
+        return self.verify_batch([claim])[0]
+
+    async def verify_async(self, claim: str) -> Dict:
+        """
+        Async variant of verify() for use from request handlers.
+        """
+        return (await self.verify_batch_async([claim]))[0]
+
+    def verify_batch(self, claims: List[str]) -> List[Dict]:
+        """
+        Verifies several claims with one Gemini call.
+        Returns one result dict per claim, in order.
+        """
+        logger.debug("🔎 Verifying claims", count=len(claims))
+
+        # Evidence for every claim is gathered concurrently
+        queries = [query for claim in claims for query in self._evidence_queries(claim)]
+        results = self.search_tool.search_many(queries, max_results=3)
+        evidence = [self._dedupe(direct + factcheck) for direct, factcheck in zip(results[::2], results[1::2])]
+
+        return self._verify_with_evidence(claims, evidence)
+
+    async def verify_batch_async(self, claims: List[str]) -> List[Dict]:
+        """
+        Async variant of verify_batch(): searches run concurrently on the event
+        loop and the blocking Gemini call runs in a worker thread.
         """
+        logger.debug("🔎 Verifying claims", count=len(claims))
+        evidence = await asyncio.gather(*(self._gather_evidence_async(claim) for claim in claims))
+        return await asyncio.to_thread(self._verify_with_evidence, claims, list(evidence))
+
+    def _verify_with_evidence(self, claims: List[str], evidence: List[List[Dict]]) -> List[Dict]:
+        """Ask Gemini for verdicts on every claim that has evidence"""
+        results: List[Optional[Dict]] = [
+            None if unique_results else {"status": "Unverified", "reason": "No evidence found", "evidence_data": []}
+            for unique_results in evidence
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        prompt = "\n\n".join(
+            f"""CLAIM {n}: "{claims[i]}"
+Evidence from Web Search:
+{self._format_evidence(evidence[i])}"""
+            for n, i in enumerate(pending, 1)
+        )
 
         # Retry logic for API calls
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = self.model.generate_content(prompt)
-                result_text = response.text.strip()
-                
-                # Clean up any markdown code blocks
-                result_text = result_text.replace("```json", "").replace("```python", "").replace("```", "").strip()
-                
-                # Parse JSON safely instead of using eval()
-                verification_result = json.loads(result_text)
-                
-                # Validate required fields
-                if "status" not in verification_result:
-                    raise ValueError("Missing 'status' field in response")
-                
-                # Attach raw search results for the frontend to display links
-                verification_result['evidence_data'] = unique_results[:5]  # Limit to 5
-                return verification_result
-                
-            except json.JSONDecodeError as e:
-                print(f"JSON parsing error (attempt {attempt + 1}/{max_retries}): {e}")
+                model = gemini_model_with_system_prompt(self.SYSTEM_PROMPT)
+                response = model.generate_content(prompt)
+
+                # Parse JSON safely instead of using eval(), ignoring any markdown code blocks
+                verification_results = parse_json(response.text)
+                if not isinstance(verification_results, list):
+                    verification_results = [verification_results]
+
+                for position, verification_result in enumerate(verification_results):
+                    # Validate required fields
+                    if "status" not in verification_result:
+                        raise ValueError("Missing 'status' field in response")
+
+                    n = int(verification_result.pop("id", position + 1))
+                    if 1 <= n <= len(pending):
+                        i = pending[n - 1]
+                        # Attach raw search results for the frontend to display links
+                        verification_result['evidence_data'] = evidence[i][:5]  # Limit to 5
+                        results[i] = verification_result
+
+                for i in pending:
+                    if results[i] is None:
+                        results[i] = {
+                            "status": "Error",
+                            "explanation": "No verification result returned for this claim",
+                            "evidence_data": evidence[i][:5]
+                        }
+                return results
+
+            except orjson.JSONDecodeError as e:
+                logger.warning("❌ JSON parsing error", attempt=attempt + 1, max_retries=max_retries, error=str(e))
                 if attempt < max_retries - 1:
                     time.sleep(1)  # Wait before retry
                     continue
-                return {
-                    "status": "Error", 
-                    "explanation": "Failed to parse verification result",
-                    "evidence_data": unique_results[:5]
-                }
+                return self._fill_errors(results, pending, evidence, "Failed to parse verification result")
             except Exception as e:
-                print(f"Error in VerifierAgent (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.error("❌ VerifierAgent error", attempt=attempt + 1, max_retries=max_retries, error=str(e))
                 if attempt < max_retries - 1:
                     time.sleep(1)
                     continue
-                return {
-                    "status": "Error", 
-                    "explanation": str(e),
-                    "evidence_data": unique_results[:5]
-                }
+                return self._fill_errors(results, pending, evidence, str(e))
+
+    @staticmethod
+    def _evidence_queries(claim: str) -> List[str]:
+        """
+        Strategy: Run two searches to get broader context and specific fact checks
+        1. Direct search for the claim
+        2. Fact check specific search
+        """
+        return [claim, f"{claim} fact check truth"]
+
+    async def _gather_evidence_async(self, claim: str) -> List[Dict]:
+        """Search for a claim and return URL-deduplicated results"""
+        results_direct, results_factcheck = await asyncio.gather(*(
+            self.search_tool.search_async(query, max_results=3)
+            for query in self._evidence_queries(claim)
+        ))
+        return self._dedupe(results_direct + results_factcheck)
+
+    @staticmethod
+    def _dedupe(all_results: List[Dict]) -> List[Dict]:
+        """Combine and deduplicate based on URL"""
+        seen_urls = set()
+        unique_results = []
+        for r in all_results:
+            url = r.get('href')
+            if url is None or url in seen_urls:
+                continue
+            seen_urls.add(url)
+            unique_results.append(r)
+        return unique_results
+
+    @staticmethod
+    def _format_evidence(results: List[Dict]) -> str:
+        """One compact line per search result (a repr of the dicts wastes tokens)"""
+        return "\n".join(
+            f"[{i}] {r.get('title', '')} — {(r.get('body') or '')[:200]} ({r.get('href', '')})"
+            for i, r in enumerate(results[:6], 1)
+        )
 
+    @staticmethod
+    def _fill_errors(results: List[Optional[Dict]], pending: List[int], evidence: List[List[Dict]], explanation: str) -> List[Dict]:
+        """Mark every claim still waiting on the model as failed"""
+        for i in pending:
+            results[i] = {
+                "status": "Error",
+                "explanation": explanation,
+                "evidence_data": evidence[i][:5]
+            }
+        return results
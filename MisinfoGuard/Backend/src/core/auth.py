@@ -1,4 +1,7 @@
 import sqlite3
+import threading
+import hashlib
+import time
 import jwt
 import logging
 import os
@@ -12,9 +15,22 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
+# Successful password checks are remembered briefly so login retries and
+# bursts from the same client skip the KDF
+VERIFY_CACHE_TTL_SECONDS = 60
+VERIFY_CACHE_MAX_ENTRIES = 1024
+
 # Password hashing
-# Using pbkdf2_sha256 to avoid bcrypt's 72-byte limit and potential Windows binary issues
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Argon2id (argon2-cffi releases the GIL while hashing); existing pbkdf2_sha256
+# hashes still verify and are upgraded on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19 * 1024,  # OWASP-recommended Argon2id profile
+    argon2__parallelism=1
+)
 logger = logging.getLogger(__name__)
 
 # Pydantic Models for Auth
@@ -40,13 +56,24 @@ class Token(BaseModel):
 class UserManager:
     def __init__(self, db_path: str = "users.db"):
         self.db_path = db_path
+
+        # Auth calls run in worker threads, so share one autocommit connection
+        # behind a lock instead of connecting per call
+        self._lock = threading.Lock()
+        self._verified: Dict[tuple, float] = {}
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
         self._init_db()
 
     def _init_db(self):
         """Initialize the user database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+            # The UNIQUE constraint on email already creates the index used by lookups
+            with self._lock:
+                self._conn.execute("""
                     CREATE TABLE IF NOT EXISTS users (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         email TEXT UNIQUE NOT NULL,
@@ -55,9 +82,8 @@ class UserManager:
                         created_at TEXT NOT NULL
                     )
                 """)
-                conn.commit()
         except Exception as e:
-            logger.error(f"Database initialization error: {e}")
+            logger.error("Database initialization error: %s", e)
 
     def get_password_hash(self, password: str) -> str:
         return pwd_context.hash(password)
@@ -65,44 +91,72 @@ class UserManager:
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
 
+    def _check_password(self, user: Dict, password: str) -> bool:
+        """Verify a login password, reusing a recent successful check when possible"""
+        key = (user['password_hash'], hashlib.sha256(password.encode()).hexdigest())
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._verified.get(key)
+        if expires_at is not None and expires_at > now:
+            return True
+
+        verified, new_hash = pwd_context.verify_and_update(password, user['password_hash'])
+        if not verified:
+            return False
+        if new_hash:
+            self._update_password_hash(user['id'], new_hash)
+            key = (new_hash, key[1])
+
+        with self._lock:
+            if len(self._verified) >= VERIFY_CACHE_MAX_ENTRIES:
+                # Drop expired entries, then the oldest if still full
+                self._verified = {k: t for k, t in self._verified.items() if t > now}
+                if len(self._verified) >= VERIFY_CACHE_MAX_ENTRIES:
+                    del self._verified[next(iter(self._verified))]
+            self._verified[key] = now + VERIFY_CACHE_TTL_SECONDS
+        return True
+
+    def _update_password_hash(self, user_id: int, password_hash: str):
+        """Replace a stored hash that uses outdated parameters"""
+        try:
+            with self._lock:
+                self._conn.execute("UPDATE users SET password_hash = ? WHERE id = ?", (password_hash, user_id))
+        except Exception as e:
+            logger.error("Error updating password hash: %s", e)
+
     def create_user(self, user: UserSignup) -> UserResponse:
         """Register a new user"""
         try:
             password_hash = self.get_password_hash(user.password)
             created_at = datetime.utcnow().isoformat()
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self._lock:
+                cursor = self._conn.execute(
                     "INSERT INTO users (email, password_hash, name, created_at) VALUES (?, ?, ?, ?)",
                     (user.email, password_hash, user.name, created_at)
                 )
                 user_id = cursor.lastrowid
-                conn.commit()
                 
-                return UserResponse(
-                    id=user_id,
-                    email=user.email,
-                    name=user.name,
-                    created_at=created_at
-                )
+            return UserResponse(
+                id=user_id,
+                email=user.email,
+                name=user.name,
+                created_at=created_at
+            )
         except sqlite3.IntegrityError:
             raise ValueError("Email already registered")
         except Exception as e:
-            logger.error(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             raise Exception(f"Error creating user: {str(e)}")
 
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM users WHERE email = ?", (email,))
-                user = cursor.fetchone()
-                return dict(user) if user else None
+            with self._lock:
+                user = self._conn.execute("SELECT * FROM users WHERE email = ?", (email,)).fetchone()
+            return dict(user) if user else None
         except Exception as e:
-            logger.error(f"Error fetching user: {e}")
+            logger.error("Error fetching user: %s", e)
             return None
 
     def authenticate_user(self, email: str, password: str) -> Optional[UserResponse]:
@@ -111,7 +165,7 @@ class UserManager:
         if not user:
             return None
         
-        if not self.verify_password(password, user['password_hash']):
+        if not self._check_password(user, password):
             return None
             
         return UserResponse(
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+BatchHandler = Callable[[List[Any]], Awaitable[List[Any]]]
+
+class BatchScheduler:
+    """
+    Coalesces concurrent requests into batches for a single handler call
+
+    A batch is dispatched once `max_batch_size` items are queued or
+    `max_latency_ms` has passed since the first item arrived, whichever
+    comes first. The handler receives the list of queued payloads and must
+    return a list of the same length; an Exception instance in that list is
+    raised to the matching caller only.
+    """
+
+    def __init__(self, handler: BatchHandler, max_batch_size: int = 8, max_latency_ms: float = 30):
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_latency = max(0.0, max_latency_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, payload: Any) -> Any:
+        """Queue a payload and wait for its result"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    def _ensure_worker(self):
+        """Start the collector task on the running loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+
+    async def _collect(self):
+        """Group queued items into batches and hand them off for dispatch"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_latency
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without blocking collection of the next batch
+            self._loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run the handler once for the batch and resolve each waiting future"""
+        payloads = [payload for payload, _ in batch]
+
+        try:
+            results = await self.handler(payloads)
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            logger.error("❌ Batch dispatch failed", batch_size=len(batch), error=str(e))
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
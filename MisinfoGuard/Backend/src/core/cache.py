@@ -1,94 +1,110 @@
-import json
-import hashlib
-import os
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
 from typing import Optional, List
-from src.core.models import ClaimAnalysis
+
+from src.core.models import CLAIM_ANALYSIS_LIST, ClaimAnalysis
+from src.memory.memory_bank import hash_topic
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
 
 class ClaimCache:
-    """Simple file-based cache for claim analyses"""
-    
+    """Simple SQLite-backed cache for claim analyses"""
+
     def __init__(self, cache_dir: str = ".cache", ttl_hours: int = 24):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
-        self.ttl = timedelta(hours=ttl_hours)
-    
+        self.ttl_seconds = ttl_hours * 3600
+
+        # One long-lived connection; WAL lets readers proceed during writes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_dir / "claim_cache.db", check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache (
+                topic_hash TEXT PRIMARY KEY,
+                topic TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_cache_stored_at ON cache(stored_at)')
+        self._conn.commit()
+
     def _get_cache_key(self, topic: str) -> str:
         """Generate cache key from topic"""
-        return hashlib.md5(topic.lower().strip().encode()).hexdigest()
-    
+        return hash_topic(topic)
+
     def get(self, topic: str) -> Optional[List[ClaimAnalysis]]:
         """Retrieve cached analysis if available and not expired"""
         cache_key = self._get_cache_key(topic)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        
-        if not cache_file.exists():
-            return None
-        
+
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Check if expired
-            cached_at = datetime.fromisoformat(data['cached_at'])
-            if datetime.now() - cached_at > self.ttl:
-                print(f"🗑️ Cache expired for topic: {topic}")
-                cache_file.unlink()  # Delete expired cache
-                return None
-            
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT payload, stored_at FROM cache WHERE topic_hash = ?',
+                    (cache_key,)
+                ).fetchone()
+
+                if row is None:
+                    return None
+
+                payload, stored_at = row
+
+                # Check if expired
+                if time.time() - stored_at > self.ttl_seconds:
+                    logger.debug("🗑️ Cache expired", topic=topic)
+                    self._conn.execute('DELETE FROM cache WHERE topic_hash = ?', (cache_key,))
+                    self._conn.commit()
+                    return None
+
             # Convert back to ClaimAnalysis objects
-            claims = [ClaimAnalysis(**claim) for claim in data['claims']]
-            
+            claims = CLAIM_ANALYSIS_LIST.validate_json(payload)
+
             # Mark as cached
             for claim in claims:
                 claim.cached = True
-            
-            print(f"✅ Cache hit for topic: {topic}")
+
+            logger.debug("✅ Cache hit", topic=topic)
             return claims
-            
+
         except Exception as e:
-            print(f"❌ Cache read error: {e}")
+            logger.error("❌ Cache read error", error=str(e))
             return None
-    
+
     def set(self, topic: str, claims: List[ClaimAnalysis]) -> None:
         """Store analysis in cache"""
         cache_key = self._get_cache_key(topic)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        
+
         try:
-            data = {
-                'topic': topic,
-                'cached_at': datetime.now().isoformat(),
-                'claims': [claim.model_dump() for claim in claims]
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
-            
-            print(f"💾 Cached results for topic: {topic}")
-            
+            payload = CLAIM_ANALYSIS_LIST.dump_json(claims)
+
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (topic_hash, topic, payload, stored_at) VALUES (?, ?, ?, ?)',
+                    (cache_key, topic, payload, time.time())
+                )
+                self._conn.commit()
+
+            logger.debug("💾 Cached results", topic=topic)
+
         except Exception as e:
-            print(f"❌ Cache write error: {e}")
-    
+            logger.error("❌ Cache write error", error=str(e))
+
     def clear_old_entries(self) -> int:
         """Remove expired cache entries. Returns number of entries removed."""
-        removed = 0
-        
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                cached_at = datetime.fromisoformat(data['cached_at'])
-                if datetime.now() - cached_at > self.ttl:
-                    cache_file.unlink()
-                    removed += 1
-                    
-            except Exception:
-                continue
-        
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM cache WHERE stored_at < ?',
+                (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+        removed = cursor.rowcount
+
         if removed > 0:
-            print(f"🗑️ Removed {removed} expired cache entries")
-        
+            logger.info("🗑️ Removed expired cache entries", removed=removed)
+
         return removed
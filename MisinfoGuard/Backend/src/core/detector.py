@@ -1,16 +1,22 @@
-import os
-import google.generativeai as genai
-from typing import List, Optional
-from datetime import datetime
-import json
+from typing import Iterator, List, Optional
+import asyncio
+import orjson
 import time
+from itertools import chain
 from dotenv import load_dotenv
 
+from src.core.llm import gemini_model_with_system_prompt, iter_json_array_items, sdk_chunk_text
 from src.core.models import ClaimAnalysis, Evidence
 from src.tools.search import SearchTool
+from src.observability.logger import get_logger
 
 load_dotenv()
 
+logger = get_logger(__name__)
+
+# Evidence sources passed to the model per topic
+MAX_EVIDENCE_SOURCES = 8
+
 class MisinfoDetector:
     """
     Unified agent that analyzes claims for misinformation in a single pass.
@@ -46,8 +52,6 @@ IMPORTANT: Return ONLY valid JSON (no markdown, no code blocks) in this exact fo
 Focus on claims that are actually misinformation. Return empty array [] if no misinformation found."""
 
     def __init__(self):
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
         self.search_tool = SearchTool()
     
     def analyze(self, topic: str) -> List[ClaimAnalysis]:
@@ -60,54 +64,87 @@ Focus on claims that are actually misinformation. Return empty array [] if no mi
         Returns:
             List of ClaimAnalysis objects
         """
-        print(f"🔍 Analyzing topic: {topic}")
+        claims = list(self.stream_analyze(topic))
+        logger.info("✅ Analysis complete", topic=topic, claims=len(claims))
+        return claims
+    
+    def stream_analyze(self, topic: str) -> Iterator[ClaimAnalysis]:
+        """
+        Analyzes a topic for misinformation claims, yielding each claim
+        as soon as the model has finished writing it.
+        """
+        logger.info("🔍 Analyzing topic", topic=topic)
         
         # 1. Gather evidence from web search
         evidence_list = self._gather_evidence(topic)
         
         if not evidence_list:
-            print("⚠️ No evidence found, returning empty results")
-            return []
+            logger.warning("⚠️ No evidence found, returning empty results", topic=topic)
+            return
         
         # 2. Analyze with unified AI prompt
-        claims = self._analyze_with_ai(topic, evidence_list)
+        yield from self._analyze_with_ai(topic, evidence_list)
+    
+    async def analyze_async(self, topic: str) -> List[ClaimAnalysis]:
+        """
+        Async variant of analyze(): searches run concurrently on the event loop
+        and the blocking Gemini call runs in a worker thread.
+        """
+        logger.info("🔍 Analyzing topic", topic=topic)
         
-        print(f"✅ Analysis complete. Found {len(claims)} claims.")
+        results_per_query = await asyncio.gather(*(
+            self.search_tool.search_async(query, max_results=3)
+            for query in self._evidence_queries(topic)
+        ))
+        evidence_list = self._merge_results(results_per_query)
+        
+        if not evidence_list:
+            logger.warning("⚠️ No evidence found, returning empty results", topic=topic)
+            return []
+        
+        claims = await asyncio.to_thread(lambda: list(self._analyze_with_ai(topic, evidence_list)))
+        logger.info("✅ Analysis complete", topic=topic, claims=len(claims))
         return claims
     
-    def _gather_evidence(self, topic: str) -> List[Evidence]:
-        """Gather evidence from multiple search queries."""
-        print(f"🔎 Gathering evidence...")
-        
-        # Search strategies
-        queries = [
+    @staticmethod
+    def _evidence_queries(topic: str) -> List[str]:
+        """Search strategies"""
+        return [
             topic,
             f"{topic} fact check",
             f"{topic} misinformation debunk"
         ]
+    
+    def _gather_evidence(self, topic: str) -> List[Evidence]:
+        """Gather evidence from multiple search queries."""
+        logger.debug("🔎 Gathering evidence")
+        
+        queries = self._evidence_queries(topic)
+        
+        # Searches are network-bound, so run them concurrently
+        results_per_query = self.search_tool.search_many(queries, max_results=3)
         
+        return self._merge_results(results_per_query)
+    
+    def _merge_results(self, results_per_query: List[List[dict]]) -> List[Evidence]:
+        """Deduplicate search results by URL and wrap them as Evidence"""
         all_results = []
         seen_urls = set()
         
-        for query in queries:
-            results = self.search_tool.search(query, max_results=3)
-            
-            for result in results:
-                url = result.get('href')
-                if url and url not in seen_urls:
-                    evidence = Evidence(
-                        title=result.get('title', 'Unknown'),
-                        url=url,
-                        snippet=result.get('body', '')[:200]
-                    )
-                    all_results.append(evidence)
-                    seen_urls.add(url)
+        for result in chain.from_iterable(results_per_query):
+            url = result.get('href')
+            if not url or url in seen_urls:
+                continue
+            seen_urls.add(url)
+            all_results.append(Evidence.from_search_result(result))
+            if len(all_results) == MAX_EVIDENCE_SOURCES:
+                break
         
-        print(f"📚 Gathered {len(all_results)} evidence sources")
-        return all_results[:8]  # Limit to top 8 sources
+        logger.debug("📚 Gathered evidence sources", count=len(all_results))
+        return all_results
     
-    def _analyze_with_ai(self, topic: str, evidence: List[Evidence]) -> List[ClaimAnalysis]:
-        """Analyze topic with AI using gathered evidence."""
+    def _analyze_with_ai(self, topic: str, evidence: List[Evidence]) -> Iterator[ClaimAnalysis]:
+        """Analyze topic with AI using gathered evidence, streaming claims as they complete."""
         
         # Prepare evidence summary for AI
         evidence_summary = "\n".join([
@@ -125,60 +162,51 @@ Analyze this topic and identify any potential misinformation claims.
 Return JSON array as specified in system prompt.
 """
         
-        # Retry logic
+        # Retry logic (only until the first claim has been handed to the caller)
         max_retries = 3
         for attempt in range(max_retries):
+            yielded = 0
             try:
-                print(f"🤖 Calling AI (attempt {attempt + 1}/{max_retries})...")
-                
-                response = self.model.generate_content([
-                    {"role": "user", "parts": [self.SYSTEM_PROMPT]},
-                    {"role": "model", "parts": ["Understood. I'll analyze topics for misinformation and return JSON."]},
-                    {"role": "user", "parts": [user_prompt]}
-                ])
-                
-                result_text = response.text.strip()
-                print(f"📝 Raw AI response: {result_text[:200]}...")
+                logger.debug("🤖 Calling AI", attempt=attempt + 1, max_retries=max_retries)
                 
-                # Clean up response
-                result_text = result_text.replace("```json", "").replace("```", "").strip()
+                # The system prompt is cached server-side; only the topic and evidence are sent
+                model = gemini_model_with_system_prompt(self.SYSTEM_PROMPT)
+                response = model.generate_content(user_prompt, stream=True)
                 
-                # Parse JSON
-                claims_data = json.loads(result_text)
-                
-                if not isinstance(claims_data, list):
-                    claims_data = [claims_data]
-                
-                # Convert to ClaimAnalysis objects
-                claims = []
-                for claim_dict in claims_data[:3]:  # Max 3 claims
+                # Parse each claim object as soon as it closes, ignoring any markdown code blocks
+                seen = 0
+                for claim_dict in iter_json_array_items(sdk_chunk_text(chunk) for chunk in response):
+                    if not isinstance(claim_dict, dict):
+                        logger.warning("⚠️ Skipping non-object claim", item=str(claim_dict)[:100])
+                        continue
+                    seen += 1
                     # Only include misinformation
                     if claim_dict.get('verdict') == 'MISINFORMATION':
-                        claim = ClaimAnalysis(
+                        yield ClaimAnalysis(
                             claim=claim_dict.get('claim', ''),
-                            verdict=claim_dict.get('verdict', 'UNCERTAIN'),
+                            final_verdict="FALSE",
                             confidence=float(claim_dict.get('confidence', 0.5)),
                             explanation=claim_dict.get('explanation', ''),
-                            evidence=evidence[:3],  # Top 3 evidence sources
-                            analyzed_at=datetime.now(),
+                            sources=evidence[:3],  # Top 3 evidence sources
+                            analyzed_at=time.time(),
                             cached=False
                         )
-                        claims.append(claim)
+                        yielded += 1
+                    if seen == 3:  # Max 3 claims
+                        break
                 
-                return claims
+                return
                 
-            except json.JSONDecodeError as e:
-                print(f"❌ JSON parse error (attempt {attempt + 1}): {e}")
-                if attempt < max_retries - 1:
+            except orjson.JSONDecodeError as e:
+                logger.warning("❌ JSON parse error", attempt=attempt + 1, error=str(e))
+                if yielded == 0 and attempt < max_retries - 1:
                     time.sleep(1)
                     continue
-                return []
+                return
                 
             except Exception as e:
-                print(f"❌ Error (attempt {attempt + 1}): {e}")
-                if attempt < max_retries - 1:
+                logger.error("❌ Error analyzing topic", attempt=attempt + 1, error=str(e))
+                if yielded == 0 and attempt < max_retries - 1:
                     time.sleep(1)
                     continue
-                return []
-        
-        return []
+                return
@@ -0,0 +1,424 @@
+import os
+import time
+import asyncio
+import threading
+from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import httpx
+import orjson
+from dotenv import load_dotenv
+
+from src.observability.logger import get_logger
+from src.observability.tracer import get_tracer
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+load_dotenv()
+
+logger = get_logger(__name__)
+
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta"
+GROQ_API_URL = "https://api.groq.com/openai/v1"
+
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+GROQ_MODEL = "llama-3.3-70b-versatile"
+EMBEDDING_MODEL = "text-embedding-004"
+
+# SDK model for the synchronous CLI agents (monitor, verifier, explainer, detector)
+GEMINI_SDK_MODEL = "gemini-2.0-flash"
+
+# Shared connection pools keep TLS + HTTP/2 sessions warm across requests
+_LIMITS = httpx.Limits(max_keepalive_connections=32)
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Lifetime of server-side cached system prompts; refreshed a minute before expiry
+CONTEXT_CACHE_TTL_SECONDS = 3600
+_CONTEXT_CACHE_REFRESH_MARGIN = 60
+
+# Gemini rejects cached contents below this many tokens, so shorter system
+# prompts are always sent inline (estimated at ~4 characters per token)
+CONTEXT_CACHE_MIN_TOKENS = 4096
+
+_gemini_client: Optional[httpx.AsyncClient] = None
+_groq_client: Optional[httpx.AsyncClient] = None
+_context_caches: Dict[Tuple[str, str], asyncio.Future] = {}
+_sdk_models: Dict[Tuple[str, str], Tuple["genai.GenerativeModel", float]] = {}
+_sdk_models_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _genai():
+    """
+    Import and configure the Gemini SDK on first use; the import pulls in
+    grpc/protobuf, which the API server (REST only) never needs
+    """
+    import google.generativeai as genai
+    genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+    return genai
+
+@lru_cache(maxsize=None)
+def get_gemini_model(model: str = GEMINI_SDK_MODEL) -> "genai.GenerativeModel":
+    """Shared SDK model, one per model name across all agents"""
+    return _genai().GenerativeModel(model)
+
+async def _inject_trace_context(request: httpx.Request):
+    """Propagate the current trace to outgoing model calls as a traceparent header"""
+    get_tracer().inject(request.headers)
+
+def get_gemini_client() -> httpx.AsyncClient:
+    """Get or create the shared Gemini REST client"""
+    global _gemini_client
+    if _gemini_client is None or _gemini_client.is_closed:
+        _gemini_client = httpx.AsyncClient(
+            base_url=GEMINI_API_URL,
+            headers={"x-goog-api-key": os.getenv("GOOGLE_API_KEY", "")},
+            http2=True,
+            limits=_LIMITS,
+            timeout=_TIMEOUT,
+            event_hooks={"request": [_inject_trace_context]}
+        )
+    return _gemini_client
+
+def get_groq_client() -> httpx.AsyncClient:
+    """Get or create the shared Groq REST client"""
+    global _groq_client
+    if _groq_client is None or _groq_client.is_closed:
+        _groq_client = httpx.AsyncClient(
+            base_url=GROQ_API_URL,
+            headers={"Authorization": f"Bearer {os.getenv('GROQ_API_KEY', '')}"},
+            http2=True,
+            limits=_LIMITS,
+            timeout=_TIMEOUT,
+            event_hooks={"request": [_inject_trace_context]}
+        )
+    return _groq_client
+
+def parse_json(text: str) -> Any:
+    """Parse the JSON payload embedded in a model response (ignores markdown fences)"""
+    # Slice from the first opening bracket to the last matching closer
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if starts:
+        start = min(starts)
+        end = text.rfind("}" if text[start] == "{" else "]")
+        if end > start:
+            return orjson.loads(text[start:end + 1])
+    return orjson.loads(text)
+
+def groq_enabled() -> bool:
+    """Groq is optional and only used when an API key is configured"""
+    return bool(os.getenv("GROQ_API_KEY"))
+
+async def gemini_generate(prompt: str, model: str = GEMINI_MODEL) -> str:
+    """Generate text with Gemini and return the first candidate"""
+    response = await get_gemini_client().post(
+        f"/models/{model}:generateContent",
+        json={"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data["candidates"][0]["content"]["parts"][0]["text"]
+
+async def gemini_embed(text: str, model: str = EMBEDDING_MODEL) -> List[float]:
+    """Embed text for semantic similarity comparisons"""
+    response = await get_gemini_client().post(
+        f"/models/{model}:embedContent",
+        json={
+            "model": f"models/{model}",
+            "content": {"parts": [{"text": text}]},
+            "taskType": "SEMANTIC_SIMILARITY"
+        }
+    )
+    response.raise_for_status()
+    return response.json()["embedding"]["values"]
+
+class JsonStreamScanner:
+    """
+    Tracks bracket depth over streamed text to detect when the first
+    top-level JSON object or array is complete (braces inside strings
+    are ignored)
+    """
+
+    def __init__(self):
+        self.done = False
+        self._parts = []
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def text(self) -> str:
+        """The JSON text seen so far, from its opening bracket"""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk of text; returns True once the value is complete"""
+        if self.done:
+            return True
+        start = 0
+        if not self._started:
+            openers = [i for i in (chunk.find("{"), chunk.find("[")) if i != -1]
+            if not openers:
+                return False
+            start = min(openers)
+            self._started = True
+
+        for i in range(start, len(chunk)):
+            char = chunk[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[start:i + 1])
+                    self.done = True
+                    return True
+
+        self._parts.append(chunk[start:])
+        return False
+
+def iter_json_array_items(chunks: Iterable[str]) -> Iterator[Any]:
+    """
+    Yield each object in a streamed top-level JSON array as soon as it
+    closes, without waiting for the rest of the array. A lone top-level
+    object (a model answering with one claim) is yielded as the only item.
+    Scalar array items are logged and skipped.
+    """
+    depth = 0
+    # Depth at which yielded values open: 2 inside an array, 1 for a bare object
+    item_depth = None
+    in_string = False
+    escaped = False
+    skipping_scalar = False
+    item: List[str] = []
+
+    for chunk in chunks:
+        start = None
+        for i, char in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                continue
+
+            if depth == 1 and item_depth == 2 and char not in "{[]":
+                if char == ",":
+                    skipping_scalar = False
+                elif not char.isspace() and not skipping_scalar:
+                    skipping_scalar = True
+                    logger.warning("⚠️ Skipping non-object JSON array item")
+
+            if char == '"':
+                in_string = True
+            elif char in "{[":
+                depth += 1
+                if depth == 1:
+                    item_depth = 1 if char == "{" else 2
+                if depth == item_depth:
+                    start = i
+            elif char in "}]" and depth:
+                depth -= 1
+                if depth == item_depth - 1:
+                    item.append(chunk[start or 0:i + 1])
+                    yield orjson.loads("".join(item))
+                    item = []
+                    start = None
+                if depth == 0:
+                    return
+
+        if item_depth and depth >= item_depth:
+            item.append(chunk[start or 0:])
+
+async def _stream_json(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: Dict,
+    extract_text: Callable[[Dict], Optional[str]],
+    params: Optional[Dict] = None
+) -> str:
+    """Read a server-sent event stream until the first JSON value in the output is complete"""
+    scanner = JsonStreamScanner()
+    async with client.stream("POST", url, json=payload, params=params) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            text = extract_text(orjson.loads(data))
+            if text and scanner.feed(text):
+                # Leaving the block closes the stream, cancelling any trailing generation
+                break
+    return scanner.text
+
+def _gemini_chunk_text(chunk: Dict) -> Optional[str]:
+    """Text delta from a streamed Gemini response chunk"""
+    candidates = chunk.get("candidates") or [{}]
+    parts = candidates[0].get("content", {}).get("parts") or [{}]
+    return parts[0].get("text")
+
+def _groq_chunk_text(chunk: Dict) -> Optional[str]:
+    """Text delta from a streamed Groq completion chunk"""
+    choices = chunk.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content")
+
+def _cacheable(system_prompt: str) -> bool:
+    """Whether a system prompt is large enough for Gemini's context cache"""
+    return len(system_prompt) // 4 >= CONTEXT_CACHE_MIN_TOKENS
+
+async def _create_context_cache(system_prompt: str, model: str) -> Tuple[Optional[str], float]:
+    """Upload a system prompt to Gemini's context cache; returns (name, refresh_at)"""
+    try:
+        response = await get_gemini_client().post(
+            "/cachedContents",
+            json={
+                "model": f"models/{model}",
+                "systemInstruction": {"parts": [{"text": system_prompt}]},
+                "ttl": f"{CONTEXT_CACHE_TTL_SECONDS}s"
+            }
+        )
+        response.raise_for_status()
+        name = response.json()["name"]
+        return name, time.time() + CONTEXT_CACHE_TTL_SECONDS - _CONTEXT_CACHE_REFRESH_MARGIN
+    except Exception as e:
+        # e.g. a model without caching support; send the prompt inline until the next TTL
+        logger.warning("⚠️ Context cache creation failed, sending system prompt inline", model=model, error=str(e))
+        return None, time.time() + CONTEXT_CACHE_TTL_SECONDS
+
+def get_context_cache(system_prompt: str, model: str = GEMINI_MODEL) -> Optional[str]:
+    """
+    Cached-content name for a system prompt, or None to send it inline. The
+    cache is created (and refreshed on expiry) in the background, so requests
+    never wait on it
+    """
+    if not _cacheable(system_prompt):
+        return None
+
+    key = (model, system_prompt)
+    pending = _context_caches.get(key)
+    if pending is None or (pending.done() and (pending.cancelled() or pending.result()[1] <= time.time())):
+        pending = asyncio.ensure_future(_create_context_cache(system_prompt, model))
+        _context_caches[key] = pending
+    if not pending.done():
+        return None
+    name, _ = pending.result()
+    return name
+
+def sdk_chunk_text(chunk) -> str:
+    """Text of a streamed SDK response chunk; empty for chunks without parts (e.g. a blocked or final chunk)"""
+    try:
+        return chunk.text
+    except ValueError:
+        return ""
+
+def gemini_model_with_system_prompt(system_prompt: str, model: str = GEMINI_SDK_MODEL) -> "genai.GenerativeModel":
+    """
+    SDK model for the CLI agents whose static system prompt lives in Gemini's
+    context cache (sync counterpart of get_context_cache), refreshed on expiry
+    """
+    key = (model, system_prompt)
+    # Holding the lock while creating means concurrent callers share one cache
+    with _sdk_models_lock:
+        entry = _sdk_models.get(key)
+        if entry is not None and entry[1] > time.time():
+            return entry[0]
+
+        genai = _genai()
+        instance = None
+        if _cacheable(system_prompt):
+            try:
+                cache = genai.caching.CachedContent.create(
+                    model=f"models/{model}",
+                    system_instruction=system_prompt,
+                    ttl=timedelta(seconds=CONTEXT_CACHE_TTL_SECONDS)
+                )
+                instance = genai.GenerativeModel.from_cached_content(cache)
+                refresh_at = time.time() + CONTEXT_CACHE_TTL_SECONDS - _CONTEXT_CACHE_REFRESH_MARGIN
+            except Exception as e:
+                logger.warning("⚠️ Context cache creation failed, sending system prompt inline", model=model, error=str(e))
+
+        if instance is None:
+            # Too short to cache (or the cache failed); send it as a plain system instruction
+            instance = genai.GenerativeModel(model, system_instruction=system_prompt)
+            refresh_at = time.time() + CONTEXT_CACHE_TTL_SECONDS
+
+        _sdk_models[key] = (instance, refresh_at)
+        return instance
+
+async def gemini_generate_json(
+    prompt: str,
+    model: str = GEMINI_MODEL,
+    max_tokens: int = 300,
+    system_prompt: Optional[str] = None
+) -> str:
+    """Stream a Gemini response and stop as soon as its JSON payload is complete"""
+    payload = {
+        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+        "generationConfig": {"maxOutputTokens": max_tokens}
+    }
+    if system_prompt:
+        cache_name = get_context_cache(system_prompt, model)
+        if cache_name:
+            payload["cachedContent"] = cache_name
+        else:
+            payload["systemInstruction"] = {"parts": [{"text": system_prompt}]}
+
+    return await _stream_json(
+        get_gemini_client(),
+        f"/models/{model}:streamGenerateContent",
+        payload,
+        _gemini_chunk_text,
+        params={"alt": "sse"}
+    )
+
+async def groq_chat_json(
+    prompt: str,
+    model: str = GROQ_MODEL,
+    temperature: float = 0.1,
+    max_tokens: int = 300,
+    system_prompt: Optional[str] = None
+) -> str:
+    """Stream a Groq completion and stop as soon as its JSON payload is complete"""
+    # A fixed system message keeps the prompt prefix identical across calls,
+    # which is what Groq's automatic prompt caching keys on
+    messages = [{"role": "user", "content": prompt}]
+    if system_prompt:
+        messages.insert(0, {"role": "system", "content": system_prompt})
+
+    return await _stream_json(
+        get_groq_client(),
+        "/chat/completions",
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
+        },
+        _groq_chunk_text
+    )
+
+async def aclose():
+    """Close the shared clients (called on application shutdown)"""
+    global _gemini_client, _groq_client
+    for client in (_gemini_client, _groq_client):
+        if client is not None:
+            await client.aclose()
+    _gemini_client = None
+    _groq_client = None
+    _context_caches.clear()
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal, Dict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_serializer, field_validator
+from typing import Any, List, Optional, Literal, Dict
 from datetime import datetime
+import time
 
 class Evidence(BaseModel):
     """Evidence source supporting the claim analysis"""
@@ -9,8 +10,18 @@ class Evidence(BaseModel):
     snippet: str = ""
     credibility: Optional[str] = None  # high, medium, low
     
-    class Config:
-        json_schema_extra = {
+    @classmethod
+    def from_search_result(cls, result: Dict[str, Any], credibility: Optional[str] = None) -> "Evidence":
+        """Build Evidence from a search result dict (tolerates missing or null title/body)"""
+        return cls(
+            title=result.get('title') or 'Unknown',
+            url=result['href'],
+            snippet=(result.get('body') or '')[:200],
+            credibility=credibility
+        )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "CDC Vaccine Safety Study",
                 "url": "https://cdc.gov/vaccines/safety",
@@ -18,9 +29,13 @@ class Evidence(BaseModel):
                 "credibility": "high"
             }
         }
+    )
 
 class AIVerdict(BaseModel):
     """Verdict from a single AI model"""
+    # Allow the `model_name` field on pydantic < 2.10
+    model_config = ConfigDict(protected_namespaces=())
+    
     model_name: str
     verdict: Literal["TRUE", "FALSE", "MISLEADING", "UNVERIFIED"]
     confidence: float
@@ -48,17 +63,32 @@ class ClaimAnalysis(BaseModel):
         default_factory=list,
         description="Credible sources with links"
     )
-    analyzed_at: datetime = Field(
-        default_factory=datetime.now,
-        description="When this analysis was performed"
+    analyzed_at: float = Field(
+        default_factory=time.time,
+        description="When this analysis was performed (epoch seconds, ISO 8601 in JSON)"
     )
     cached: bool = Field(
         default=False,
         description="Whether this result came from cache"
     )
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("analyzed_at", mode="before")
+    @classmethod
+    def _parse_analyzed_at(cls, value: Any) -> Any:
+        """Accept ISO strings and datetimes (JSON responses, older cache entries)"""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return value
+    
+    @field_serializer("analyzed_at", when_used="json")
+    def _serialize_analyzed_at(self, value: float) -> str:
+        """Keep the ISO 8601 wire format, converting only when emitting JSON"""
+        return datetime.fromtimestamp(value).isoformat()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "claim": "Vaccines cause autism",
                 "final_verdict": "FALSE",
@@ -73,6 +103,10 @@ class ClaimAnalysis(BaseModel):
                 "cached": False
             }
         }
+    )
+
+# Compiled once; (de)serializes stored claim lists straight to and from JSON bytes
+CLAIM_ANALYSIS_LIST = TypeAdapter(List[ClaimAnalysis])
 
 class AnalysisRequest(BaseModel):
     """Request to verify a claim"""
@@ -0,0 +1,34 @@
+from typing import Iterable
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over hex digests (e.g. topic hashes)
+
+    The keys are already uniformly distributed hashes, so the probe
+    positions are taken straight from slices of the digest rather than
+    rehashing. No false negatives; false positives just fall through to
+    the real lookup.
+
+    The defaults (128 KiB, 4 probes) give ~1% false positives at 100k keys.
+    """
+
+    def __init__(self, size_bytes: int = 128 * 1024, num_hashes: int = 4):
+        self._bits = bytearray(size_bytes)
+        self._num_bits = size_bytes * 8
+        self._num_hashes = num_hashes
+
+    def _positions(self, digest: str):
+        # 8 hex chars = 32 bits per probe; a 128-bit digest covers up to 4 probes
+        for i in range(self._num_hashes):
+            yield int(digest[i * 8:(i + 1) * 8], 16) % self._num_bits
+
+    def add(self, digest: str):
+        for position in self._positions(digest):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, digests: Iterable[str]):
+        for digest in digests:
+            self.add(digest)
+
+    def __contains__(self, digest: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
@@ -1,10 +1,40 @@
 import sqlite3
-import json
+import threading
 import hashlib
+import re
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Optional, List
-from src.core.models import ClaimAnalysis
+from src.core.models import CLAIM_ANALYSIS_LIST, ClaimAnalysis
+from src.memory.bloom import BloomFilter
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Entries older than this are ignored
+MEMORY_TTL_SECONDS = 24 * 3600
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+@lru_cache(maxsize=4096)
+def hash_topic(topic: str) -> str:
+    """
+    Generate consistent hash for a topic or claim
+
+    Case, punctuation and whitespace are normalized away so slightly
+    different phrasings of the same rumor share one cache entry. Punctuation
+    becomes a space rather than being deleted, so "1.5" and "15" stay
+    distinct. Results are memoized since the same claim is hashed by
+    several layers.
+    """
+    normalized = _WHITESPACE_RE.sub(" ", _PUNCTUATION_RE.sub(" ", topic.casefold())).strip()
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
 
 class MemoryBank:
     """
@@ -14,127 +44,169 @@ class MemoryBank:
     
     def __init__(self, db_path: str = "memory_bank.db"):
         self.db_path = Path(db_path)
+        
+        # One long-lived autocommit connection shared across threads; WAL lets
+        # readers proceed while a write is in progress
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        
+        # In-memory front gate over stored topic hashes. Other workers share the
+        # database file, so a negative answer is only trusted after picking up
+        # rows written since the last refresh (tracked by id).
+        self._bloom = BloomFilter()
+        self._bloom_last_id = 0
+        
         self._init_database()
     
     def _init_database(self):
         """Initialize SQLite database schema"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS claims (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                topic_hash TEXT NOT NULL,
-                topic TEXT NOT NULL,
-                claims_json TEXT NOT NULL,
-                stored_at TIMESTAMP NOT NULL,
-                accessed_count INTEGER DEFAULT 0,
-                last_accessed TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_topic_hash 
-            ON claims(topic_hash)
-        ''')
-        
-        conn.commit()
-        conn.close()
-        print("💾 Memory Bank initialized")
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS claims (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    topic_hash TEXT NOT NULL,
+                    topic TEXT NOT NULL,
+                    claims_json TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_count INTEGER DEFAULT 0,
+                    last_accessed REAL
+                )
+            ''')
+            
+            self._migrate_timestamps()
+            
+            self._conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_topic_hash 
+                ON claims(topic_hash)
+            ''')
+            
+            self._refresh_bloom()
+        
+        logger.info("💾 Memory Bank initialized")
+    
+    def _migrate_timestamps(self):
+        """Convert ISO-8601 timestamps written by older versions to epoch seconds"""
+        rows = self._conn.execute('''
+            SELECT id, stored_at, last_accessed
+            FROM claims
+            WHERE typeof(stored_at) = 'text' OR typeof(last_accessed) = 'text'
+        ''').fetchall()
+        if not rows:
+            return
+        
+        def to_epoch(value):
+            return datetime.fromisoformat(value).timestamp() if isinstance(value, str) else value
+        
+        self._conn.executemany(
+            'UPDATE claims SET stored_at = ?, last_accessed = ? WHERE id = ?',
+            [(to_epoch(stored_at), to_epoch(last_accessed), row_id) for row_id, stored_at, last_accessed in rows]
+        )
+        logger.info("💾 Migrated memory bank timestamps to epoch seconds", rows=len(rows))
+    
+    def _refresh_bloom(self):
+        """Add rows stored since the last refresh (by any process) to the Bloom filter; caller holds the lock"""
+        rows = self._conn.execute(
+            'SELECT id, topic_hash FROM claims WHERE id > ? ORDER BY id',
+            (self._bloom_last_id,)
+        ).fetchall()
+        if rows:
+            self._bloom.update(topic_hash for _, topic_hash in rows)
+            self._bloom_last_id = rows[-1][0]
+    
+    def _might_contain(self, topic_hash: str) -> bool:
+        """Bloom filter check, refreshed from the database before a negative answer is returned"""
+        if topic_hash in self._bloom:
+            return True
+        with self._lock:
+            # A rowid range scan past the newest known id; normally returns nothing
+            self._refresh_bloom()
+        return topic_hash in self._bloom
     
     def _hash_topic(self, topic: str) -> str:
         """Generate consistent hash for topic"""
-        return hashlib.md5(topic.lower().strip().encode()).hexdigest()
+        return hash_topic(topic)
     
     def get(self, topic: str) -> Optional[List[ClaimAnalysis]]:
         """
         Retrieve claims from memory bank if available
         Returns None if not found or expired (24hr TTL)
         """
-        topic_hash = self._hash_topic(topic)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT claims_json, stored_at 
-            FROM claims 
-            WHERE topic_hash = ? 
-            ORDER BY stored_at DESC 
-            LIMIT 1
-        ''', (topic_hash,))
-        
-        result = cursor.fetchone()
-        
-        if not result:
-            conn.close()
+        return self.get_by_hash(self._hash_topic(topic))
+    
+    def get_by_hash(self, topic_hash: str) -> Optional[List[ClaimAnalysis]]:
+        """Retrieve claims by topic hash (e.g. a near-duplicate match from the semantic index)"""
+        if not self._might_contain(topic_hash):
             return None
         
-        claims_json, stored_at = result
-        
-        # Check if expired (24 hours TTL)
-        stored_time = datetime.fromisoformat(stored_at)
-        if datetime.now() - stored_time > timedelta(hours=24):
-            print(f"🗑️ Memory expired for: {topic}")
-            conn.close()
+        now = time.time()
+        cutoff = now - MEMORY_TTL_SECONDS
+        
+        with self._lock:
+            if _HAS_RETURNING:
+                # One statement reads the fresh entries and bumps their access tracking
+                rows = self._conn.execute('''
+                    UPDATE claims 
+                    SET accessed_count = accessed_count + 1,
+                        last_accessed = ?
+                    WHERE topic_hash = ? AND stored_at > ?
+                    RETURNING claims_json, stored_at
+                ''', (now, topic_hash, cutoff)).fetchall()
+            else:
+                rows = self._conn.execute('''
+                    SELECT claims_json, stored_at 
+                    FROM claims 
+                    WHERE topic_hash = ? AND stored_at > ?
+                ''', (topic_hash, cutoff)).fetchall()
+                if rows:
+                    self._conn.execute('''
+                        UPDATE claims 
+                        SET accessed_count = accessed_count + 1,
+                            last_accessed = ?
+                        WHERE topic_hash = ? AND stored_at > ?
+                    ''', (now, topic_hash, cutoff))
+        
+        # Missing, or older than the 24 hour TTL
+        if not rows:
             return None
         
-        # Update access tracking
-        cursor.execute('''
-            UPDATE claims 
-            SET accessed_count = accessed_count + 1,
-                last_accessed = ?
-            WHERE topic_hash = ?
-        ''', (datetime.now().isoformat(), topic_hash))
-        
-        conn.commit()
-        conn.close()
+        # Newest entry wins if a topic was stored more than once
+        claims_json, _ = max(rows, key=lambda row: row[1])
         
         # Deserialize claims
-        claims_data = json.loads(claims_json)
-        claims = [ClaimAnalysis(**claim) for claim in claims_data]
+        claims = CLAIM_ANALYSIS_LIST.validate_json(claims_json)
         
         # Mark as cached
         for claim in claims:
             claim.cached = True
         
-        print(f"✅ Memory hit for: {topic}")
+        logger.debug("✅ Memory hit", topic_hash=topic_hash)
         return claims
     
     def store(self, topic: str, claims: List[ClaimAnalysis]):
         """Store claims in memory bank"""
         topic_hash = self._hash_topic(topic)
         
-        claims_json = json.dumps(
-            [claim.model_dump() for claim in claims],
-            default=str
-        )
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO claims (topic_hash, topic, claims_json, stored_at)
-            VALUES (?, ?, ?, ?)
-        ''', (topic_hash, topic, claims_json, datetime.now().isoformat()))
+        claims_json = CLAIM_ANALYSIS_LIST.dump_json(claims).decode()
         
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO claims (topic_hash, topic, claims_json, stored_at)
+                VALUES (?, ?, ?, ?)
+            ''', (topic_hash, topic, claims_json, time.time()))
+            self._bloom.add(topic_hash)
         
-        print(f"💾 Stored in memory bank: {topic}")
+        logger.debug("💾 Stored in memory bank", topic=topic)
     
     def get_stats(self) -> dict:
         """Get memory bank statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM claims')
-        total_entries = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT SUM(accessed_count) FROM claims')
-        total_accesses = cursor.fetchone()[0] or 0
-        
-        conn.close()
+        with self._lock:
+            total_entries, total_accesses = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(accessed_count), 0) FROM claims'
+            ).fetchone()
         
         return {
             "total_entries": total_entries,
@@ -0,0 +1,112 @@
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+def token_jaccard(a: str, b: str) -> float:
+    """Word-set overlap between two texts, used to reject embedding matches that share no context"""
+    tokens_a = set(_TOKEN_RE.findall(a.lower()))
+    tokens_b = set(_TOKEN_RE.findall(b.lower()))
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+class SemanticIndex:
+    """
+    Near-duplicate claim lookup over embedding vectors
+
+    Vectors are L2-normalized and kept in one in-memory matrix, so a lookup
+    is a single matrix-vector product (cosine similarity). Rows are persisted
+    next to the memory bank and reloaded at startup.
+    """
+
+    def __init__(self, db_path: str = "memory_bank.db", threshold: float = 0.92):
+        self.db_path = Path(db_path)
+        self.threshold = threshold
+        self._hashes: List[str] = []
+        self._positions = {}
+        self._matrix: Optional[np.ndarray] = None
+        
+        # One long-lived autocommit connection shared across threads; WAL lets
+        # readers proceed while a write is in progress
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        
+        self._init_database()
+
+    def _init_database(self):
+        """Create the embeddings table and load existing vectors"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS claim_embeddings (
+                    topic_hash TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL
+                )
+            ''')
+            rows = self._conn.execute('SELECT topic_hash, vector FROM claim_embeddings').fetchall()
+
+        if rows:
+            self._hashes = [topic_hash for topic_hash, _ in rows]
+            self._positions = {topic_hash: i for i, topic_hash in enumerate(self._hashes)}
+            self._matrix = np.stack([np.frombuffer(vector, dtype=np.float32) for _, vector in rows])
+        logger.info("🧭 Semantic index loaded", entries=len(self._hashes))
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        """Unit-length float32 copy of a vector"""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def search(self, vector: Sequence[float], k: int = 5) -> List[Tuple[str, float]]:
+        """Return up to k (topic_hash, similarity) pairs above the threshold, best first"""
+        if self._matrix is None:
+            return []
+        query = self._normalize(vector)
+        if query.shape[0] != self._matrix.shape[1]:
+            return []
+
+        scores = self._matrix @ query
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (self._hashes[i], float(scores[i]))
+            for i in top
+            if scores[i] >= self.threshold
+        ]
+
+    def add(self, topic_hash: str, vector: Sequence[float]):
+        """Index a vector under a memory bank topic hash (replacing any previous one)"""
+        row = self._normalize(vector)
+        if self._matrix is not None and row.shape[0] != self._matrix.shape[1]:
+            logger.warning("⚠️ Skipping embedding with mismatched dimension", dimension=row.shape[0])
+            return
+
+        position = self._positions.get(topic_hash)
+        if position is not None:
+            self._matrix[position] = row
+        else:
+            self._positions[topic_hash] = len(self._hashes)
+            self._hashes.append(topic_hash)
+            self._matrix = row[np.newaxis, :] if self._matrix is None else np.vstack([self._matrix, row])
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO claim_embeddings (topic_hash, vector) VALUES (?, ?)',
+                (topic_hash, row.tobytes())
+            )
+
+    def __len__(self) -> int:
+        return len(self._hashes)
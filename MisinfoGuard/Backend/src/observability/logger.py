@@ -1,9 +1,42 @@
 import logging
-import json
+import logging.handlers
+import os
 import sys
+import threading
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Dict
-import uuid
+from typing import Any, Dict, Optional
+
+import orjson
+
+# Per-request trace ID; asyncio copies the context into every task a request spawns
+TRACE_ID: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
+
+# Log lines are written to stdout in batches of this size; WARNING and above
+# flush immediately (set to 1 to write every line as it happens)
+LOG_BUFFER_LINES = int(os.getenv("LOG_BUFFER_LINES", "64"))
+
+# Buffered lines are also written out at least this often, so a quiet server doesn't hold them
+LOG_FLUSH_INTERVAL_SECONDS = float(os.getenv("LOG_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+# One buffer shared by every logger, so lines from different modules keep their order
+_handler = logging.handlers.MemoryHandler(
+    capacity=max(LOG_BUFFER_LINES, 1),
+    flushLevel=logging.WARNING,
+    target=logging.StreamHandler(sys.stdout)
+)
+_handler.setLevel(logging.INFO)
+_flusher_stop = threading.Event()
+
+def flush_logs():
+    """Write out any buffered log lines"""
+    _handler.flush()
+
+def _flush_periodically():
+    while not _flusher_stop.wait(LOG_FLUSH_INTERVAL_SECONDS):
+        flush_logs()
+
+threading.Thread(target=_flush_periodically, name="log-flusher", daemon=True).start()
 
 class StructuredLogger:
     """
@@ -15,44 +48,44 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
         
-        # JSON formatter
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.INFO)
-        self.logger.addHandler(handler)
-        
-        self.trace_id = None
-    
-    def set_trace_id(self, trace_id: str):
-        """Set trace ID for request correlation"""
-        self.trace_id = trace_id
+        # JSON lines go through the shared buffer so INFO lines don't each take the stream lock and flush
+        self.logger.addHandler(_handler)
     
     def _format_message(self, level: str, message: str, **kwargs) -> str:
-        """Format log as JSON"""
+        """Format log as JSON (callers check the level first, so filtered messages are never serialized)"""
         log_entry = {
             "timestamp": datetime.now().isoformat(),
             "level": level,
             "logger": self.logger.name,
             "message": message,
-            "trace_id": self.trace_id or "no-trace",
+            "trace_id": TRACE_ID.get() or "no-trace",
             **kwargs
         }
-        return json.dumps(log_entry)
+        return orjson.dumps(log_entry, default=str).decode()
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Whether a message at this level would be emitted (lets callers skip building it)"""
+        return self.logger.isEnabledFor(level)
     
-    def info(self, message: str, **kwargs):
-        """Log info level message"""
-        self.logger.info(self._format_message("INFO", message, **kwargs))
+    def info(self, message: str, *args, **kwargs):
+        """Log info level message (%-style args are only formatted if it is emitted)"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message("INFO", message % args if args else message, **kwargs))
     
-    def error(self, message: str, **kwargs):
-        """Log error level message"""
-        self.logger.error(self._format_message("ERROR", message, **kwargs))
+    def error(self, message: str, *args, **kwargs):
+        """Log error level message (%-style args are only formatted if it is emitted)"""
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_message("ERROR", message % args if args else message, **kwargs))
     
-    def warning(self, message: str, **kwargs):
-        """Log warning level message"""
-        self.logger.warning(self._format_message("WARNING", message, **kwargs))
+    def warning(self, message: str, *args, **kwargs):
+        """Log warning level message (%-style args are only formatted if it is emitted)"""
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_message("WARNING", message % args if args else message, **kwargs))
     
-    def debug(self, message: str, **kwargs):
-        """Log debug level message"""
-        self.logger.debug(self._format_message("DEBUG", message, **kwargs))
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug level message (%-style args are only formatted if it is emitted)"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message("DEBUG", message % args if args else message, **kwargs))
 
 # Global logger registry
 _loggers: Dict[str, StructuredLogger] = {}
@@ -62,8 +95,3 @@ def get_logger(name: str) -> StructuredLogger:
     if name not in _loggers:
         _loggers[name] = StructuredLogger(name)
     return _loggers[name]
-
-def set_trace_id_for_all(trace_id: str):
-    """Set trace ID for all loggers"""
-    for logger in _loggers.values():
-        logger.set_trace_id(trace_id)
@@ -1,6 +1,112 @@
+from array import array
 from collections import defaultdict
-from typing import Dict
-import time
+from typing import Dict, Optional
+import math
+
+import numpy as np
+
+# Quantiles reported for every histogram
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Most recent observations kept raw per histogram (8 bytes each) for exact short-window stats
+RECENT_WINDOW = 1024
+
+class HistogramSketch:
+    """
+    Bounded log-bucket sketch (DDSketch-style) for histogram observations
+
+    Each value lands in bucket ceil(log_gamma(value / min_value)), so any
+    quantile estimate is within rel_err of the true value. Memory is fixed
+    (1024 int64 buckets = 8 KiB) no matter how many values are observed;
+    count/sum/min/max are kept as running scalars.
+
+    The last RECENT_WINDOW raw values are also kept in a ring buffer of C
+    doubles, so /metrics can report what latency looks like right now
+    rather than averaged over the whole process lifetime.
+    """
+    
+    __slots__ = ("gamma", "_log_gamma", "min_value", "buckets", "count", "sum", "min", "max", "recent", "_quantile_cache")
+    
+    def __init__(self, rel_err: float = 0.01, num_buckets: int = 1024, min_value: float = 1e-6):
+        self.gamma = (1 + rel_err) / (1 - rel_err)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.buckets = np.zeros(num_buckets, dtype=np.int64)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.recent = array('d', bytes(8 * RECENT_WINDOW))
+        # Quantile results since the last add(); None once a new value arrives
+        self._quantile_cache: Optional[Dict] = None
+    
+    def add(self, value: float):
+        """Record one value"""
+        self.recent[self.count % RECENT_WINDOW] = value
+        self.count += 1
+        self._quantile_cache = None
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        
+        # Values below min_value share bucket 0; values past the top are clamped
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = min(math.ceil(math.log(value / self.min_value) / self._log_gamma), len(self.buckets) - 1)
+        self.buckets[index] += 1
+    
+    def _cached(self, key, compute):
+        """Reuse a quantile result until the next observation"""
+        if self._quantile_cache is None:
+            self._quantile_cache = {}
+        result = self._quantile_cache.get(key)
+        if result is None:
+            result = self._quantile_cache[key] = compute()
+        return result
+    
+    def quantiles(self, qs=QUANTILES) -> np.ndarray:
+        """Estimate quantiles (cached until the next add())"""
+        return self._cached(("sketch", tuple(qs)), lambda: self._scan_quantiles(qs))
+    
+    def _scan_quantiles(self, qs) -> np.ndarray:
+        """Estimate quantiles with one cumulative scan over the buckets"""
+        ranks = np.asarray(qs) * (self.count - 1)
+        indices = np.searchsorted(np.cumsum(self.buckets), ranks, side="right")
+        # Bucket i covers (min_value * gamma^(i-1), min_value * gamma^i]
+        estimates = self.min_value * 2 * self.gamma ** indices / (self.gamma + 1)
+        return np.clip(estimates, self.min, self.max)
+    
+    def summary(self) -> Dict:
+        """count/sum/avg/min/max plus quantiles, as served by /metrics"""
+        if not self.count:
+            return {"count": 0, "sum": 0, "avg": 0, "min": 0, "max": 0}
+        
+        stats = {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count,
+            "min": self.min,
+            "max": self.max
+        }
+        for q, estimate in zip(QUANTILES, self.quantiles()):
+            stats[f"p{round(q * 100)}"] = float(estimate)
+        
+        # Exact stats over the ring buffer (slot order doesn't matter for these)
+        window = np.frombuffer(self.recent, dtype=np.float64)[:min(self.count, RECENT_WINDOW)]
+        recent = {
+            "count": len(window),
+            "avg": float(window.mean()),
+            "min": float(window.min()),
+            "max": float(window.max())
+        }
+        window_quantiles = self._cached(("recent", QUANTILES), lambda: np.quantile(window, QUANTILES))
+        for q, value in zip(QUANTILES, window_quantiles):
+            recent[f"p{round(q * 100)}"] = float(value)
+        stats["recent"] = recent
+        return stats
 
 class MetricsCollector:
     """
@@ -9,8 +115,9 @@ class MetricsCollector:
     """
     
     def __init__(self):
-        self.counters: Dict[str, int] = defaultdict(int)
-        self.histograms: Dict[str, list] = defaultdict(list)
+        # One-slot signed 64-bit cells; a Counter keeps a reference to its cell
+        self.counters: Dict[str, array] = defaultdict(lambda: array('q', [0]))
+        self.histograms: Dict[str, HistogramSketch] = defaultdict(HistogramSketch)
         self.gauges: Dict[str, float] = {}
     
     def counter(self, name: str) -> 'Counter':
@@ -28,16 +135,10 @@ class MetricsCollector:
     def get_metrics(self) -> Dict:
         """Get all metrics as dict"""
         return {
-            "counters": dict(self.counters),
+            "counters": {name: cell[0] for name, cell in self.counters.items()},
             "histograms": {
-                name: {
-                    "count": len(values),
-                    "sum": sum(values),
-                    "avg": sum(values) / len(values) if values else 0,
-                    "min": min(values) if values else 0,
-                    "max": max(values) if values else 0
-                }
-                for name, values in self.histograms.items()
+                name: sketch.summary()
+                for name, sketch in self.histograms.items()
             },
             "gauges": dict(self.gauges)
         }
@@ -45,46 +146,44 @@ class MetricsCollector:
 class Counter:
     """Counter metric - monotonically increasing value"""
     
+    __slots__ = ("name", "collector", "_cell")
+    
     def __init__(self, name: str, collector: MetricsCollector):
         self.name = name
         self.collector = collector
+        # Bound once so increments skip the per-call name lookup
+        self._cell = collector.counters[name]
     
     def inc(self, value: int = 1):
         """Increment counter"""
-        self.collector.counters[self.name] += value
+        self._cell[0] += value
     
     def get(self) -> int:
         """Get current value"""
-        return self.collector.counters[self.name]
+        return self._cell[0]
 
 class Histogram:
     """Histogram metric - track distribution of values"""
     
+    __slots__ = ("name", "collector")
+    
     def __init__(self, name: str, collector: MetricsCollector):
         self.name = name
         self.collector = collector
     
     def observe(self, value: float):
         """Record observation"""
-        self.collector.histograms[self.name].append(value)
+        self.collector.histograms[self.name].add(value)
     
     def get_stats(self) -> Dict:
         """Get statistics"""
-        values = self.collector.histograms[self.name]
-        if not values:
-            return {"count": 0, "sum": 0, "avg": 0}
-        
-        return {
-            "count": len(values),
-            "sum": sum(values),
-            "avg": sum(values) / len(values),
-            "min": min(values),
-            "max": max(values)
-        }
+        return self.collector.histograms[self.name].summary()
 
 class Gauge:
     """Gauge metric - can go up or down"""
     
+    __slots__ = ("name", "collector")
+    
     def __init__(self, name: str, collector: MetricsCollector):
         self.name = name
         self.collector = collector
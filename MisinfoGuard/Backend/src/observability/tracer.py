@@ -1,61 +1,171 @@
+import inspect
+import itertools
+import logging
+import os
+import random
 import time
 import uuid
+from contextvars import ContextVar
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, Dict, Optional, Tuple
 from contextlib import contextmanager
-from src.observability.logger import get_logger
+from src.observability.logger import get_logger, TRACE_ID
 
 logger = get_logger("tracer")
 
+# Fraction of traces that record spans (head sampling, decided once per trace); 0 disables tracing
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+
+# Span ids only need to be unique within the process
+_span_ids = itertools.count(1)
+
+# W3C Trace Context header: "00-<32 hex trace id>-<16 hex parent span id>-<2 hex flags>"
+TRACEPARENT_HEADER = "traceparent"
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+# Span id of the caller's span when the trace arrived over HTTP; parent of this process's root spans
+_REMOTE_PARENT_ID: ContextVar[Optional[str]] = ContextVar("remote_parent_id", default=None)
+
+# Sampling decision of the current trace, made at its root and inherited by every span in it
+_SAMPLED: ContextVar[Optional[bool]] = ContextVar("trace_sampled", default=None)
+
+# Innermost open span of the current task/thread; parent of the next span started there
+_CURRENT_SPAN: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
 class Span:
     """
     Simple span implementation for distributed tracing
     Demonstrates: Observability - Tracing concept
     """
     
+    __slots__ = ("span_id", "parent_id", "operation_name", "start_time", "end_time", "duration", "tags", "_token")
+    
     def __init__(self, operation_name: str, parent_id: str = None):
-        self.span_id = str(uuid.uuid4())[:8]
+        self.span_id = format(next(_span_ids), '016x')
         self.parent_id = parent_id
         self.operation_name = operation_name
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.end_time = None
         self.duration = None
-        self.tags = {}
+        # Allocated on the first set_tag()
+        self.tags = None
+        # Makes this the current span until finish() restores the parent
+        self._token = _CURRENT_SPAN.set(self)
     
     def set_tag(self, key: str, value: Any):
         """Add tag to span"""
+        if self.tags is None:
+            self.tags = {}
         self.tags[key] = value
     
     def finish(self):
         """Complete the span"""
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         self.duration = self.end_time - self.start_time
         
-        logger.info(
-            f"Span completed: {self.operation_name}",
-            span_id=self.span_id,
-            parent_span_id=self.parent_id,
-            duration_ms=round(self.duration * 1000, 2),
-            **self.tags
-        )
+        try:
+            _CURRENT_SPAN.reset(self._token)
+        except ValueError:
+            # Finished from a different context than it was started in; nothing to restore here
+            pass
+        
+        # Skip building the log call entirely when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Span completed: {self.operation_name}",
+                span_id=self.span_id,
+                parent_span_id=self.parent_id,
+                duration_ms=round(self.duration * 1000, 2),
+                **(self.tags or {})
+            )
+
+
+class _NullSpan:
+    """Stand-in for unsampled operations; every method is a no-op"""
+    
+    __slots__ = ()
+    span_id = None
+    
+    def set_tag(self, key: str, value: Any):
+        pass
+    
+    def finish(self):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+def _is_hex(value: Optional[str], length: int) -> bool:
+    """Whether value is exactly `length` lowercase hex digits"""
+    return (
+        value is not None
+        and len(value) == length
+        and all(c in "0123456789abcdef" for c in value)
+    )
 
 class Tracer:
     """Simple tracer for operation tracking"""
     
-    def __init__(self):
-        self.active_span = None
-        self.trace_id = None
+    def __init__(self, sample_rate: float = TRACE_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+    
+    @property
+    def active_span(self) -> Optional[Span]:
+        """Innermost open span in the calling task or thread"""
+        return _CURRENT_SPAN.get()
     
-    def start_trace(self, trace_id: str = None):
-        """Start a new trace"""
-        self.trace_id = trace_id or str(uuid.uuid4())
-        return self.trace_id
+    def start_trace(self, trace_id: str = None, parent_span_id: str = None, sampled: Optional[bool] = None):
+        """
+        Start a new trace, or continue one whose context was extracted from a
+        request (honoring the caller's sampling decision when given). The
+        trace context is per task, so this returns the trace ID to use
+        """
+        _REMOTE_PARENT_ID.set(parent_span_id)
+        _SAMPLED.set(self._decide() if sampled is None else sampled)
+        return trace_id or uuid.uuid4().hex
+    
+    def _decide(self) -> bool:
+        """Head-sampling decision for a new trace"""
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+    
+    def inject(self, carrier: Dict[str, str]):
+        """Write the current trace context into outgoing headers as a W3C traceparent"""
+        trace_id = TRACE_ID.get()
+        if not _is_hex(trace_id, 32) or trace_id == _INVALID_TRACE_ID:
+            return
+        span = _CURRENT_SPAN.get()
+        span_id = span.span_id if span else _REMOTE_PARENT_ID.get() or format(next(_span_ids), '016x')
+        flags = "01" if _SAMPLED.get() is not False else "00"
+        carrier[TRACEPARENT_HEADER] = f"00-{trace_id}-{span_id}-{flags}"
+    
+    @staticmethod
+    def extract(carrier) -> Optional[Tuple[str, str, bool]]:
+        """Read (trace_id, parent_span_id, sampled) from an incoming traceparent header, if valid"""
+        header = carrier.get(TRACEPARENT_HEADER)
+        if not header:
+            return None
+        parts = header.strip().lower().split("-", 4)
+        if len(parts) < 4 or parts[0] == "ff" or not _is_hex(parts[0], 2):
+            return None
+        _, trace_id, span_id, flags = parts[:4]
+        if not (_is_hex(trace_id, 32) and _is_hex(span_id, 16) and _is_hex(flags, 2)):
+            return None
+        if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+            return None
+        return trace_id, span_id, bool(int(flags, 16) & 1)
     
     def start_span(self, operation_name: str) -> Span:
-        """Start a new span"""
-        parent_id = self.active_span.span_id if self.active_span else None
-        span = Span(operation_name, parent_id)
-        return span
+        """Start a new span, or return the shared no-op span if the trace is not sampled"""
+        sampled = _SAMPLED.get()
+        if sampled is None:
+            # No trace started (e.g. outside a request): decide once for this context
+            sampled = self._decide()
+            _SAMPLED.set(sampled)
+        if not sampled:
+            return _NULL_SPAN
+        parent = _CURRENT_SPAN.get()
+        parent_id = parent.span_id if parent else _REMOTE_PARENT_ID.get()
+        return Span(operation_name, parent_id)
 
 # Global tracer instance
 _tracer = Tracer()
@@ -70,26 +180,28 @@ def trace_operation(operation_name: str):
     Usage: @trace_operation("my_operation")
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            tracer = get_tracer()
-            span = tracer.start_span(operation_name)
+        # Pick the wrapper once, at decoration time
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                span = _tracer.start_span(operation_name)
+                
+                try:
+                    result = await func(*args, **kwargs)
+                    span.set_tag("status", "success")
+                    return result
+                except Exception as e:
+                    span.set_tag("status", "error")
+                    span.set_tag("error", str(e))
+                    raise
+                finally:
+                    span.finish()
             
-            try:
-                result = await func(*args, **kwargs)
-                span.set_tag("status", "success")
-                return result
-            except Exception as e:
-                span.set_tag("status", "error")
-                span.set_tag("error", str(e))
-                raise
-            finally:
-                span.finish()
+            return async_wrapper
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            tracer = get_tracer()
-            span = tracer.start_span(operation_name)
+            span = _tracer.start_span(operation_name)
             
             try:
                 result = func(*args, **kwargs)
@@ -102,12 +214,7 @@ def trace_operation(operation_name: str):
             finally:
                 span.finish()
         
-        # Return appropriate wrapper based on function type
-        import inspect
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
@@ -119,8 +226,7 @@ def trace_context(operation_name: str):
         with trace_context("my_operation"):
             # code here
     """
-    tracer = get_tracer()
-    span = tracer.start_span(operation_name)
+    span = _tracer.start_span(operation_name)
     
     try:
         yield span
@@ -1,5 +1,97 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from duckduckgo_search import DDGS
-from typing import List, Dict
+from duckduckgo_search.exceptions import DuckDuckGoSearchException
+from typing import Callable, List, Dict, Tuple
+from src.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Text results are restricted to India (English) to avoid irrelevant foreign results
+SEARCH_REGION = "in-en"
+
+# Repeated queries within this window are served from memory
+SEARCH_CACHE_TTL_SECONDS = 300
+SEARCH_CACHE_MAX_ENTRIES = 1024
+
+# Every search runs on this one long-lived pool, so each worker's DDGS
+# client (and its keep-alive connections) is reused across calls
+SEARCH_WORKERS = 8
+_executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="search")
+
+_local = threading.local()
+
+# (kind, normalized query, max_results) -> (expires_at, results), least recently used first
+_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Tuple[Dict, ...]]]" = OrderedDict()
+# Searches currently running; concurrent identical queries wait on the same one
+_inflight: Dict[Tuple[str, str, int], Future] = {}
+_cache_lock = threading.Lock()
+
+def _ddgs() -> DDGS:
+    """
+    Long-lived DDGS client for the calling thread, so keep-alive connections
+    and cookies carry over between searches (the client itself is not
+    thread-safe, hence one per thread)
+    """
+    ddgs = getattr(_local, "ddgs", None)
+    if ddgs is None:
+        ddgs = _local.ddgs = DDGS()
+    return ddgs
+
+def _search_impl(kind: str, query: str, max_results: int) -> Tuple[Dict, ...]:
+    """Run one DuckDuckGo query of the given kind ("text" or "news")"""
+    if kind == "news":
+        return tuple(_ddgs().news(query, max_results=max_results))
+    return tuple(_ddgs().text(query, region=SEARCH_REGION, max_results=max_results))
+
+def _cached_search(kind: str, query: str, max_results: int) -> Tuple[Dict, ...]:
+    """
+    TTL/LRU-cached, single-flight search: a repeated query is answered from
+    memory, and concurrent identical queries share one HTTP request.
+    Failures raise (to every waiter) and are not cached.
+    """
+    # The normalized form only keys the cache; DDGS gets the query as written
+    # (lower-casing would turn OR operators into plain words)
+    key = (kind, query.lower().strip(), max_results)
+    now = time.monotonic()
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            _cache.move_to_end(key)
+            return entry[1]
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+
+    if not leader:
+        return future.result()
+
+    try:
+        results = _search_impl(kind, query, max_results)
+    except BaseException as e:
+        with _cache_lock:
+            del _inflight[key]
+        future.set_exception(e)
+        raise
+
+    with _cache_lock:
+        _cache[key] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, results)
+        _cache.move_to_end(key)
+        if len(_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+        del _inflight[key]
+    future.set_result(results)
+    return results
+
+def _submit(fn: Callable, *args) -> Future:
+    """Run fn on the search pool, keeping the caller's context (trace ID) for its logs"""
+    return _executor.submit(contextvars.copy_context().run, fn, *args)
 
 class SearchTool:
     def __init__(self):
@@ -8,24 +100,40 @@ class SearchTool:
     def search(self, query: str, max_results: int = 5) -> List[Dict]:
         """
         Performs a DuckDuckGo search and returns a list of results.
+        Repeated queries (ignoring case and surrounding whitespace) are served from memory.
         """
         try:
-            with DDGS() as ddgs:
-                # Restrict to India (English) to avoid irrelevant foreign results
-                results = list(ddgs.text(query, region='in-en', max_results=max_results))
-            return results
-        except Exception as e:
-            print(f"Error during search: {e}")
+            return list(_cached_search("text", query, max_results))
+        except DuckDuckGoSearchException as e:
+            # Network errors, timeouts and rate limits; anything else is a bug and propagates
+            logger.warning("⚠️ Search failed", query=query, error=str(e))
             return []
 
     def news_search(self, query: str, max_results: int = 5) -> List[Dict]:
         """
-        Performs a DuckDuckGo news search.
+        Performs a DuckDuckGo news search (cached like search()).
         """
         try:
-            with DDGS() as ddgs:
-                results = list(ddgs.news(query, max_results=max_results))
-            return results
-        except Exception as e:
-            print(f"Error during news search: {e}")
+            return list(_cached_search("news", query, max_results))
+        except DuckDuckGoSearchException as e:
+            logger.warning("⚠️ News search failed", query=query, error=str(e))
             return []
+
+    def search_many(self, queries: List[str], max_results: int = 5) -> List[List[Dict]]:
+        """
+        Runs search() for several queries concurrently; results are in query order.
+        """
+        futures = [_submit(self.search, query, max_results) for query in queries]
+        return [future.result() for future in futures]
+
+    async def search_async(self, query: str, max_results: int = 5) -> List[Dict]:
+        """
+        Runs search() on the search pool so async callers don't block the event loop.
+        """
+        return await asyncio.wrap_future(_submit(self.search, query, max_results))
+
+    async def news_search_async(self, query: str, max_results: int = 5) -> List[Dict]:
+        """
+        Runs news_search() on the search pool so async callers don't block the event loop.
+        """
+        return await asyncio.wrap_future(_submit(self.news_search, query, max_results))
@@ -0,0 +1,22 @@
+import unittest
+
+from src.memory.memory_bank import hash_topic
+
+
+class HashTopicTest(unittest.TestCase):
+    def test_normalizes_case_punctuation_and_whitespace(self):
+        self.assertEqual(
+            hash_topic("Mumbai CST bomb threat!"),
+            hash_topic("  mumbai   cst bomb threat ")
+        )
+
+    def test_decimal_point_is_not_dropped(self):
+        # Deleting punctuation used to turn "1.5" into "15"
+        self.assertNotEqual(
+            hash_topic("Govt pays Rs 1.5 crore compensation"),
+            hash_topic("Govt pays Rs 15 crore compensation")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()